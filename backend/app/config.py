@@ -82,6 +82,11 @@ class Settings(BaseSettings):
         """Path al archivo JSON de zonas horarias"""
         return self.data_directory / "timezones.json"
     
+    @property
+    def TIMEZONES_CACHE_FILE(self) -> Path:
+        """Path al caché en disco del catálogo de zonas horarias"""
+        return self.data_directory / "timezones_cache.json"
+    
     @property
     def SETTINGS_FILE(self) -> Path:
         """Path al archivo JSON de configuración de usuario"""
@@ -3,7 +3,7 @@ Implementación de Lista Circular Doble (Circular Doubly Linked List).
 Estructura de datos fundamental para el proyecto de reloj digital.
 """
 
-from typing import TypeVar, Generic, Callable, Optional, List, Any
+from typing import TypeVar, Generic, Callable, Iterable, Optional, List, Any
 from app.data_structures.node import Node
 
 
@@ -31,11 +31,63 @@ class CircularDoublyLinkedList(Generic[T]):
     
     Attributes:
         head (Node[T] | None): Primer nodo de la lista
+        _size (int): Contador interno de nodos, mantenido en cada
+                     inserción/eliminación para no recorrer la lista
+        _version (int): Contador de modificaciones; permite a los
+                        consumidores cachear vistas y detectar cambios
+        _node_pool (List[Node[T]]): Freelist de nodos desenlazados listos
+                                    para reutilizar en inserciones
     """
     
+    # Tope del pool: acota la memoria retenida por nodos reciclados
+    _POOL_MAX = 4096
+    
     def __init__(self) -> None:
         """Inicializa una lista circular doble vacía."""
         self.head: Optional[Node[T]] = None
+        self._size: int = 0
+        self._version: int = 0
+        self._node_pool: List[Node[T]] = []
+    
+    # ========================================================================
+    # POOL DE NODOS (FREELIST)
+    # ========================================================================
+    
+    def _acquire_node(self, data: T) -> Node[T]:
+        """
+        Obtiene un nodo para insertar, reciclando del pool si hay.
+        
+        Reutilizar nodos desenlazados evita el costo de construir un
+        objeto nuevo (y la presión sobre el recolector de basura) en
+        cargas con muchas inserciones y eliminaciones alternadas.
+        
+        Args:
+            data (T): Dato que llevará el nodo
+            
+        Returns:
+            Node[T]: Nodo listo para enlazar
+        """
+        if self._node_pool:
+            node = self._node_pool.pop()
+            node.data = data
+            return node
+        return Node(data)
+    
+    def _release_node(self, node: Node[T]) -> None:
+        """
+        Devuelve un nodo desenlazado al pool para reutilizarlo.
+        
+        Limpia sus referencias para no retener datos vivos. Si el pool
+        está lleno se descarta el nodo y lo recoge el GC normalmente.
+        
+        Args:
+            node (Node[T]): Nodo ya desenlazado de la lista
+        """
+        if len(self._node_pool) < self._POOL_MAX:
+            node.data = None
+            node.prev = None
+            node.next = None
+            self._node_pool.append(node)
     
     # ========================================================================
     # MÉTODOS DE CONSULTA
@@ -50,38 +102,48 @@ class CircularDoublyLinkedList(Generic[T]):
         """
         return self.head is None
     
-    def size(self) -> int:
+    @property
+    def version(self) -> int:
         """
-        Cuenta el número de nodos en la lista.
+        Contador de modificaciones de la lista.
+        
+        Cambia con cada inserción/eliminación; los consumidores pueden
+        usarlo como clave de memoización de vistas derivadas.
         
+        Returns:
+            int: Versión actual
+        """
+        return self._version
+    
+    def size(self) -> int:
+        """
+        Retorna el número de nodos en la lista.
+
+        O(1): devuelve el contador interno mantenido por las operaciones
+        de inserción/eliminación, sin recorrer la lista.
+
         Returns:
             int: Cantidad de nodos
         """
-        if self.is_empty():
-            return 0
-        
-        count = 1
-        current = self.head.next
-        
-        # Recorrer hasta volver al head
-        while current != self.head:
-            count += 1
-            current = current.next
-        
-        return count
+        return self._size
     
     # ========================================================================
     # MÉTODOS DE INSERCIÓN
     # ========================================================================
     
-    def insert_at_beginning(self, data: T) -> None:
+    def insert_at_beginning(self, data: T) -> Node[T]:
         """
         Inserta un nuevo nodo al inicio de la lista.
         
         Args:
             data (T): Dato a insertar
+            
+        Returns:
+            Node[T]: Nodo recién insertado (útil para mantener índices externos)
         """
-        new_node = Node(data)
+        new_node = self._acquire_node(data)
+        self._size += 1
+        self._version += 1
         
         if self.is_empty():
             # Lista vacía: el nodo apunta a sí mismo
@@ -102,15 +164,22 @@ class CircularDoublyLinkedList(Generic[T]):
             
             # El nuevo nodo es el nuevo head
             self.head = new_node
+        
+        return new_node
     
-    def insert_at_end(self, data: T) -> None:
+    def insert_at_end(self, data: T) -> Node[T]:
         """
         Inserta un nuevo nodo al final de la lista.
         
         Args:
             data (T): Dato a insertar
+            
+        Returns:
+            Node[T]: Nodo recién insertado (útil para mantener índices externos)
         """
-        new_node = Node(data)
+        new_node = self._acquire_node(data)
+        self._size += 1
+        self._version += 1
         
         if self.is_empty():
             # Lista vacía: el nodo apunta a sí mismo
@@ -128,8 +197,10 @@ class CircularDoublyLinkedList(Generic[T]):
             # Actualizar conexiones
             last.next = new_node
             self.head.prev = new_node
+        
+        return new_node
     
-    def insert_sorted(self, data: T, key_func: Callable[[T], Any]) -> None:
+    def insert_sorted(self, data: T, key_func: Callable[[T], Any]) -> Node[T]:
         """
         Inserta un dato manteniendo el orden según una función de comparación.
         Útil para alarmas ordenadas por hora.
@@ -138,15 +209,20 @@ class CircularDoublyLinkedList(Generic[T]):
             data (T): Dato a insertar
             key_func (Callable): Función que extrae la clave de ordenamiento
                                  Ejemplo: lambda x: x["time"] para ordenar por hora
+            
+        Returns:
+            Node[T]: Nodo recién insertado (útil para mantener índices externos)
         """
-        new_node = Node(data)
+        new_node = self._acquire_node(data)
+        self._size += 1
+        self._version += 1
         
         if self.is_empty():
             # Lista vacía
             new_node.next = new_node
             new_node.prev = new_node
             self.head = new_node
-            return
+            return new_node
         
         # Obtener la clave del nuevo dato
         new_key = key_func(data)
@@ -162,7 +238,7 @@ class CircularDoublyLinkedList(Generic[T]):
             last.next = new_node
             
             self.head = new_node
-            return
+            return new_node
         
         # Buscar posición correcta
         current = self.head
@@ -179,7 +255,86 @@ class CircularDoublyLinkedList(Generic[T]):
                 break
             
             current = current.next
-    
+        
+        return new_node
+
+    def extend(self, items: Iterable[T]) -> List[Node[T]]:
+        """
+        Agrega una secuencia de datos al final de la lista en una sola pasada.
+
+        Construye la cadena de nodos enlazándolos entre sí y la empalma a
+        la lista con un número constante de reconexiones, en vez de pagar
+        una inserción por elemento. Pensado para cargas masivas (p. ej.
+        reconstruir la lista desde JSON al arrancar).
+
+        Args:
+            items (Iterable[T]): Datos a agregar, en el orden deseado
+
+        Returns:
+            List[Node[T]]: Nodos creados, en el mismo orden que los datos
+        """
+        new_nodes = [self._acquire_node(data) for data in items]
+        if not new_nodes:
+            return new_nodes
+
+        # Enlazar la cadena nueva entre sí
+        for i in range(len(new_nodes) - 1):
+            new_nodes[i].next = new_nodes[i + 1]
+            new_nodes[i + 1].prev = new_nodes[i]
+
+        first, last = new_nodes[0], new_nodes[-1]
+
+        if self.is_empty():
+            # La cadena completa pasa a ser la lista
+            self.head = first
+            first.prev = last
+            last.next = first
+        else:
+            # Empalmar entre el último nodo actual y el head
+            old_last = self.head.prev
+
+            old_last.next = first
+            first.prev = old_last
+
+            last.next = self.head
+            self.head.prev = last
+
+        self._size += len(new_nodes)
+        self._version += 1
+        return new_nodes
+
+    def insert_before_node(self, node: Node[T], data: T) -> Node[T]:
+        """
+        Inserta un nuevo nodo justo antes de un nodo existente, en O(1).
+
+        Útil cuando el llamador ya conoce la posición de inserción
+        (por ejemplo, mediante un índice externo ordenado) y no necesita
+        recorrer la lista como hace insert_sorted.
+
+        Args:
+            node (Node[T]): Nodo existente ante el cual insertar
+            data (T): Dato a insertar
+
+        Returns:
+            Node[T]: Nodo recién insertado
+        """
+        new_node = self._acquire_node(data)
+        self._size += 1
+        self._version += 1
+
+        # Conectar entre node.prev y node
+        new_node.next = node
+        new_node.prev = node.prev
+
+        node.prev.next = new_node
+        node.prev = new_node
+
+        # Si insertamos antes del head, el nuevo nodo pasa a ser head
+        if node == self.head:
+            self.head = new_node
+
+        return new_node
+
     # ========================================================================
     # MÉTODOS DE ELIMINACIÓN
     # ========================================================================
@@ -214,6 +369,9 @@ class CircularDoublyLinkedList(Generic[T]):
                     current.prev.next = current.next
                     current.next.prev = current.prev
                 
+                self._size -= 1
+                self._version += 1
+                self._release_node(current)
                 return True
             
             current = current.next
@@ -224,6 +382,80 @@ class CircularDoublyLinkedList(Generic[T]):
         
         return False
     
+    def remove_node(self, node: Node[T]) -> None:
+        """
+        Desenlaza un nodo conocido de la lista en O(1).
+        
+        A diferencia de delete(), no busca el dato: el llamador ya tiene
+        el nodo (típicamente desde un índice externo id -> nodo).
+        
+        Args:
+            node (Node[T]): Nodo a desenlazar (debe pertenecer a esta lista)
+        """
+        if self.is_empty():
+            return
+        
+        # Caso 1: Solo hay un nodo
+        if node.next == node:
+            self.head = None
+        else:
+            # Caso 2: El nodo a eliminar es el head
+            if node == self.head:
+                self.head = node.next
+            
+            # Reconectar los nodos adyacentes
+            node.prev.next = node.next
+            node.next.prev = node.prev
+        
+        self._size -= 1
+        self._version += 1
+        self._release_node(node)
+    
+    def move_to_position(self, node: Node[T], position: int) -> None:
+        """
+        Mueve un nodo existente a una posición dada (0 = head), en sitio.
+        
+        Cirugía de punteros pura: el nodo se desenlaza y se vuelve a
+        empalmar sin pasar por el pool ni alocar nada, así las
+        referencias externas al nodo siguen siendo válidas. Cuesta el
+        recorrido hasta la posición destino más reconexiones O(1).
+        
+        Args:
+            node (Node[T]): Nodo a mover (debe pertenecer a esta lista)
+            position (int): Posición destino; si es mayor o igual al
+                            último índice, el nodo queda al final
+        """
+        if self._size <= 1:
+            return
+        
+        # Desenlazar sin reciclar: el mismo nodo se empalma de nuevo
+        if node is self.head:
+            self.head = node.next
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        
+        # Localizar el sucesor en la lista ya sin el nodo
+        if position >= self._size - 1:
+            # Al final: insertar antes del head sin cambiar el head
+            successor = self.head
+            becomes_head = False
+        else:
+            successor = self.head
+            for _ in range(position):
+                successor = successor.next
+            becomes_head = successor is self.head and position == 0
+        
+        # Empalmar antes del sucesor
+        node.next = successor
+        node.prev = successor.prev
+        successor.prev.next = node
+        successor.prev = node
+        
+        if becomes_head:
+            self.head = node
+        
+        self._version += 1
+    
     def delete_by_condition(self, condition: Callable[[T], bool]) -> int:
         """
         Elimina todos los nodos que cumplan una condición.
@@ -258,8 +490,15 @@ class CircularDoublyLinkedList(Generic[T]):
         return deleted_count
     
     def clear(self) -> None:
-        """Vacía completamente la lista."""
+        """
+        Vacía completamente la lista.
+        
+        Los nodos se sueltan en bloque (no se reciclan uno a uno): soltar
+        la referencia al head es O(1) y el GC libera la cadena completa.
+        """
         self.head = None
+        self._size = 0
+        self._version += 1
     
     # ========================================================================
     # MÉTODOS DE BÚSQUEDA
@@ -395,15 +634,14 @@ class CircularDoublyLinkedList(Generic[T]):
         if self.is_empty():
             return []
         
-        result = []
+        # Prealocar con el tamaño conocido: una sola asignación en vez de
+        # realocaciones amortizadas de append
+        result: List[T] = [None] * self._size
         current = self.head
         
-        while True:
-            result.append(current.data)
+        for i in range(self._size):
+            result[i] = current.data
             current = current.next
-            
-            if current == self.head:
-                break
         
         return result
     
@@ -417,15 +655,13 @@ class CircularDoublyLinkedList(Generic[T]):
         if self.is_empty():
             return []
         
-        result = []
+        # Prealocar con el tamaño conocido (ver get_all)
+        result: List[T] = [None] * self._size
         current = self.head.prev  # Empezar desde el último
         
-        while True:
-            result.append(current.data)
+        for i in range(self._size):
+            result[i] = current.data
             current = current.prev
-            
-            if current == self.head.prev:
-                break
         
         return result
     
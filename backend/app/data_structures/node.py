@@ -34,7 +34,12 @@ class Node(Generic[T]):
         >>> node2 = Node("Hello")
         >>> node3 = Node({"id": 1, "name": "Alarm"})
     """
-    
+
+    # Sin __dict__ por instancia: los tres atributos viven en slots de
+    # acceso directo, cada nodo ocupa menos memoria y leer data/prev/next
+    # en los recorridos es más rápido
+    __slots__ = ('data', 'prev', 'next')
+
     def __init__(self, data: T) -> None:
         """
         Inicializa un nuevo nodo con el dato proporcionado.
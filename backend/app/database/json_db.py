@@ -3,14 +3,86 @@ Sistema de persistencia con archivos JSON.
 Maneja lectura y escritura de datos en archivos JSON.
 """
 
+import atexit
 import json
+import queue
+import threading
+import time
+
+# orjson (C) serializa 5-10x más rápido que json stdlib; si no está
+# instalado se usa la ruta stdlib equivalente
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# ESTADO DE ESCRITURAS DIFERIDAS
+# ============================================================================
+
+# Compartido a nivel de módulo y keyed por ruta: varias instancias de
+# JSONDatabase sobre el mismo archivo coalescen sus escrituras en un
+# solo slot pendiente, y cualquier lectura puede forzar el flush antes
+# de leer datos obsoletos.
+_pending_writes: dict[Path, tuple["JSONDatabase", Callable[[], Any]]] = {}
+_pending_lock = threading.Lock()
+
+# Un único hilo escritor consume notificaciones de esta cola y hace las
+# escrituras en orden: el camino caliente de los servicios solo encola,
+# nunca toca el disco
+_write_queue: "queue.Queue[None]" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+
+
+def _writer_loop() -> None:
+    """
+    Bucle del hilo escritor: espera una notificación, deja pasar una
+    ventana breve para que la ráfaga termine de coalescer, drena las
+    notificaciones acumuladas y escribe una sola vez por archivo sucio.
+    """
+    while True:
+        _write_queue.get()
+        time.sleep(JSONDatabase.FLUSH_DELAY)
+        
+        # Drenar notificaciones redundantes de la misma ráfaga
+        try:
+            while True:
+                _write_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        _flush_all()
+
+
+def _flush_all() -> None:
+    """Materializa todas las escrituras pendientes, una por archivo."""
+    with _pending_lock:
+        items = list(_pending_writes.values())
+        _pending_writes.clear()
+    
+    for db, supplier in items:
+        db.write(supplier())
+
+
+def _ensure_writer_started() -> None:
+    """Arranca el hilo escritor la primera vez que alguien difiere una escritura."""
+    global _writer_thread
+    if _writer_thread is None:
+        with _pending_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(
+                    target=_writer_loop, name="json-db-writer", daemon=True
+                )
+                _writer_thread.start()
+
+
 class JSONDatabase:
     """
     Clase para gestionar persistencia de datos en archivos JSON.
@@ -22,6 +94,9 @@ class JSONDatabase:
         file_path (Path): Ruta al archivo JSON
     """
     
+    # Ventana de coalescencia para escrituras diferidas (segundos)
+    FLUSH_DELAY = 0.2
+    
     def __init__(self, file_path: Path | str):
         """
         Inicializa la base de datos JSON.
@@ -31,6 +106,8 @@ class JSONDatabase:
         """
         self.file_path = Path(file_path)
         self._ensure_file_exists()
+        # Garantizar que una escritura pendiente no se pierda al salir
+        atexit.register(self.flush)
     
     def _ensure_file_exists(self) -> None:
         """
@@ -55,11 +132,21 @@ class JSONDatabase:
         Raises:
             json.JSONDecodeError: Si el archivo no es JSON válido
         """
+        # Si hay una escritura diferida pendiente sobre este archivo,
+        # materializarla primero para no leer datos obsoletos
+        if self.file_path in _pending_writes:
+            self.flush()
+        
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"Datos leídos de {self.file_path.name}")
-                return data
+            if orjson is not None:
+                # orjson parsea ~2x más rápido que json stdlib
+                with open(self.file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            logger.debug(f"Datos leídos de {self.file_path.name}")
+            return data
         except json.JSONDecodeError as e:
             logger.error(f"Error decodificando JSON en {self.file_path}: {e}")
             # Retornar lista vacía si el archivo está corrupto
@@ -79,14 +166,58 @@ class JSONDatabase:
             bool: True si se escribió exitosamente, False en caso contrario
         """
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            if orjson is not None:
+                # Mismo formato que la ruta stdlib: indentación de 2 y
+                # UTF-8 sin escapar (orjson nunca escapa no-ASCII)
+                payload = orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2, default=str
+                )
+                with open(self.file_path, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(self.file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
             logger.debug(f"Datos escritos en {self.file_path.name}")
             return True
         except Exception as e:
             logger.error(f"Error escribiendo en {self.file_path}: {e}")
             return False
     
+    def write_delayed(self, supplier: Callable[[], Any]) -> None:
+        """
+        Programa una escritura diferida y coalescida.
+        
+        Deja el supplier en el slot pendiente de este archivo y notifica
+        al hilo escritor único; varias llamadas en ráfaga colapsan en una
+        sola escritura con el último estado (el supplier se evalúa recién
+        al momento del flush). El camino caliente queda puramente en
+        memoria: encolar es microsegundos, el disco lo toca otro hilo.
+        
+        Args:
+            supplier: Función sin argumentos que produce los datos a escribir
+        """
+        with _pending_lock:
+            _pending_writes[self.file_path] = (self, supplier)
+        
+        _ensure_writer_started()
+        _write_queue.put(None)
+    
+    def flush(self) -> bool:
+        """
+        Materializa la escritura diferida pendiente de este archivo, si la hay.
+        
+        Returns:
+            bool: True si no había nada pendiente o se escribió con éxito
+        """
+        with _pending_lock:
+            entry = _pending_writes.pop(self.file_path, None)
+        
+        if entry is None:
+            return True
+        
+        _, supplier = entry
+        return self.write(supplier())
+    
     def read_as_dict(self) -> dict:
         """
         Lee datos del archivo asegurando que sea un diccionario.
@@ -121,6 +252,66 @@ class JSONDatabase:
         data.append(item)
         return self.write(data)
     
+    def append_to_array(self, item: Any) -> bool:
+        """
+        Agrega un elemento al final de un array JSON en disco sin reescribirlo.
+        
+        Empalma el elemento justo antes del ']' de cierre (leyendo solo la
+        cola del archivo), así agregar es O(1) en bytes escritos en vez de
+        re-serializar el array completo. Si el archivo no parece un array
+        bien formado, cae al camino append() clásico de releer/reescribir.
+        
+        Args:
+            item: Elemento a agregar (serializable a JSON)
+            
+        Returns:
+            bool: True si se agregó exitosamente
+        """
+        # Con una reescritura completa diferida pendiente, el contenido
+        # del archivo es obsoleto y el flush lo va a reemplazar con el
+        # estado completo (que ya incluye este elemento): empalmar ahora
+        # sería trabajo de disco desperdiciado
+        if self.file_path in _pending_writes:
+            return True
+        
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(item, default=str)
+            else:
+                payload = json.dumps(
+                    item, ensure_ascii=False, default=str
+                ).encode('utf-8')
+            
+            with open(self.file_path, 'r+b') as f:
+                # Leer solo la cola para ubicar el cierre del array
+                f.seek(0, 2)
+                size = f.tell()
+                read_from = max(0, size - 64)
+                f.seek(read_from)
+                tail = f.read()
+                
+                close = tail.rfind(b']')
+                if close == -1:
+                    return self.append(item)
+                
+                before = tail[:close].rstrip()
+                if not before and read_from > 0:
+                    # Demasiado espacio en blanco para decidir: camino lento
+                    return self.append(item)
+                
+                # Array vacío -> sin coma separadora
+                sep = b'\n  ' if before.endswith(b'[') else b',\n  '
+                
+                f.seek(read_from + len(before))
+                f.write(sep + payload + b'\n]')
+                f.truncate()
+            
+            logger.debug(f"Elemento agregado in-place en {self.file_path.name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error agregando en {self.file_path}: {e}")
+            return False
+    
     def clear(self) -> bool:
         """
         Limpia el archivo escribiendo una lista vacía.
@@ -9,7 +9,7 @@ import time
 from datetime import datetime
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import logging
 
 # Importar routers
@@ -39,6 +39,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs" if app_settings.DEBUG else None,  # Swagger UI solo en dev
     redoc_url="/api/redoc" if app_settings.DEBUG else None,  # ReDoc solo en dev
+    default_response_class=ORJSONResponse,  # orjson es 2-5x más rápido que json stdlib
 )
 
 
@@ -113,6 +114,26 @@ async def log_requests(request: Request, call_next):
         raise
 
 
+# ============================================================================
+# MANEJADORES GLOBALES DE EXCEPCIONES
+# ============================================================================
+
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    """
+    Convierte ValueError (incluye ValidationError de Pydantic) en 400.
+    
+    Evita repetir try/except en cada endpoint que delega en los servicios:
+    los errores de datos inválidos suben hasta aquí y se responden una
+    sola vez, sin costo en el camino feliz.
+    """
+    logger.warning(f"⚠️ Datos inválidos en {request.method} {request.url.path}: {exc}")
+    return ORJSONResponse(
+        status_code=400,
+        content={"detail": str(exc)},
+    )
+
+
 # ============================================================================
 # INCLUIR ROUTERS
 # ============================================================================
@@ -150,7 +171,7 @@ app.include_router(
 # ENDPOINTS BÁSICOS
 # ============================================================================
 
-@app.get("/", response_class=JSONResponse)
+@app.get("/")
 async def root():
     """
     Endpoint raíz - Mensaje de bienvenida.
@@ -164,7 +185,7 @@ async def root():
     }
 
 
-@app.get("/health", response_class=JSONResponse)
+@app.get("/health")
 async def health_check():
     """
     Health check endpoint - Verifica que la API esté funcionando.
@@ -179,7 +200,7 @@ async def health_check():
     }
 
 
-@app.get("/api", response_class=JSONResponse)
+@app.get("/api")
 async def api_info():
     """
     Información general de la API y endpoints disponibles.
@@ -4,6 +4,7 @@ Todos los endpoints usan AlarmService con lista circular doble.
 """
 
 from fastapi import APIRouter, HTTPException, status, Query, Depends
+from functools import lru_cache
 from typing import Optional
 
 from app.models.alarm import Alarm, AlarmCreate, AlarmUpdate
@@ -22,13 +23,26 @@ router = APIRouter(
 )
 
 
+# ============================================================================
+# PLANTILLAS DE ERROR
+# ============================================================================
+
+# Precomputada a nivel de módulo: cada 404 solo hace un .format()
+ALARM_NOT_FOUND = "Alarma con ID {} no encontrada"
+
+
 # ============================================================================
 # DEPENDENCY INJECTION
 # ============================================================================
 
+@lru_cache()
 def get_alarm_service() -> AlarmService:
     """
-    Dependency para obtener instancia del servicio de alarmas.
+    Dependency para obtener el servicio de alarmas.
+    
+    Singleton: todos los requests comparten la misma instancia (y por lo
+    tanto la misma lista circular e índices), en vez de recargar el JSON
+    en cada request. El servicio es thread-safe mediante su RLock interno.
     """
     return AlarmService()
 
@@ -44,7 +58,9 @@ def get_alarm_service() -> AlarmService:
     summary="Crear alarma",
     description="Crea una nueva alarma y la inserta ordenada por hora en la lista circular"
 )
-async def create_alarm(
+# def (no async): estos handlers escriben a disco; FastAPI los
+# despacha en su threadpool y el event loop queda libre
+def create_alarm(
     alarm_data: AlarmCreate,
     service: AlarmService = Depends(get_alarm_service)
 ) -> Alarm:
@@ -101,7 +117,7 @@ async def get_alarm(
     if not alarm:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Alarma con ID {alarm_id} no encontrada"
+            detail=ALARM_NOT_FOUND.format(alarm_id)
         )
     
     return alarm
@@ -113,7 +129,7 @@ async def get_alarm(
     summary="Actualizar alarma",
     description="Actualiza una alarma existente. Si cambia la hora, se reordena en la lista"
 )
-async def update_alarm(
+def update_alarm(
     alarm_id: int,
     alarm_data: AlarmUpdate,
     service: AlarmService = Depends(get_alarm_service)
@@ -126,7 +142,7 @@ async def update_alarm(
     if not alarm:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Alarma con ID {alarm_id} no encontrada"
+            detail=ALARM_NOT_FOUND.format(alarm_id)
         )
     
     return alarm
@@ -138,7 +154,7 @@ async def update_alarm(
     summary="Eliminar alarma",
     description="Elimina una alarma de la lista circular"
 )
-async def delete_alarm(
+def delete_alarm(
     alarm_id: int,
     service: AlarmService = Depends(get_alarm_service)
 ) -> dict:
@@ -150,7 +166,7 @@ async def delete_alarm(
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Alarma con ID {alarm_id} no encontrada"
+            detail=ALARM_NOT_FOUND.format(alarm_id)
         )
     
     return {
@@ -165,7 +181,7 @@ async def delete_alarm(
     summary="Activar/Desactivar alarma",
     description="Cambia el estado enabled de una alarma"
 )
-async def toggle_alarm(
+def toggle_alarm(
     alarm_id: int,
     service: AlarmService = Depends(get_alarm_service)
 ) -> Alarm:
@@ -177,7 +193,7 @@ async def toggle_alarm(
     if not alarm:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Alarma con ID {alarm_id} no encontrada"
+            detail=ALARM_NOT_FOUND.format(alarm_id)
         )
     
     return alarm
@@ -211,19 +227,15 @@ async def navigate_alarm(
 ) -> Alarm:
     """
     Navega circularmente entre alarmas.
-    """
-    if direction not in ["next", "prev"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Direction debe ser 'next' o 'prev'"
-        )
     
+    La validación de direction ya la hace el Query regex.
+    """
     alarm = service.navigate_alarm(alarm_id, direction)
     
     if not alarm:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Alarma con ID {alarm_id} no encontrada"
+            detail=ALARM_NOT_FOUND.format(alarm_id)
         )
     
     return alarm
@@ -4,6 +4,7 @@ Maneja las preferencias del usuario para el reloj.
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends
+from functools import lru_cache
 
 from fastapi import Body
 from app.models.settings import Settings, SettingsUpdate, SettingsResponse
@@ -25,9 +26,14 @@ router = APIRouter(
 # DEPENDENCY INJECTION
 # ============================================================================
 
+@lru_cache()
 def get_settings_service() -> SettingsService:
     """
-    Dependency para obtener instancia del servicio de configuración.
+    Dependency para obtener el servicio de configuración.
+    
+    Singleton: todos los requests comparten la misma instancia y sus
+    caches (respuesta pre-construida, escritura diferida), en vez de
+    releer el JSON en cada request.
     """
     return SettingsService()
 
@@ -57,7 +63,9 @@ async def get_settings(
     summary="Actualizar configuración",
     description="Actualiza la configuración del usuario"
 )
-async def update_settings(
+# def (no async): estos handlers escriben a disco; FastAPI los
+# despacha en su threadpool y el event loop queda libre
+def update_settings(
     settings_data: SettingsUpdate,
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -80,7 +88,7 @@ async def update_settings(
     summary="Restaurar configuración",
     description="Restaura la configuración a valores por defecto"
 )
-async def reset_settings(
+def reset_settings(
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
     """
@@ -95,7 +103,7 @@ async def reset_settings(
     summary="Actualizar formato de hora",
     description="Actualiza solo el formato de hora"
 )
-async def update_time_format(
+def update_time_format(
     data: dict = Body(..., example={"time_format": "12h"}),  # CAMBIADO
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -115,7 +123,7 @@ async def update_time_format(
     summary="Actualizar sonido de alarma",
     description="Actualiza solo el sonido de alarma"
 )
-async def update_alarm_sound(
+def update_alarm_sound(
     data: dict = Body(..., example={"sound": "gentle"}),  # CAMBIADO
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -141,7 +149,7 @@ async def update_alarm_sound(
     summary="Actualizar volumen",
     description="Actualiza solo el volumen de alarma"
 )
-async def update_volume(
+def update_volume(
     data: dict = Body(..., example={"volume": 75}),  # CAMBIADO
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -161,7 +169,7 @@ async def update_volume(
     summary="Actualizar tema",
     description="Actualiza solo el tema de la aplicación"
 )
-async def update_theme(
+def update_theme(
     data: dict = Body(..., example={"theme": "dark"}),  # CAMBIADO
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -181,7 +189,7 @@ async def update_theme(
     summary="Aumentar volumen",
     description="Aumenta el volumen en una cantidad específica"
 )
-async def increase_volume(
+def increase_volume(
     data: dict = Body(..., example={"amount": 10}),  # CAMBIADO
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -201,7 +209,7 @@ async def increase_volume(
     summary="Disminuir volumen", 
     description="Disminuye el volumen en una cantidad específica"
 )
-async def decrease_volume(
+def decrease_volume(
     data: dict = Body(..., example={"amount": 10}),  # CAMBIADO
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -272,7 +280,7 @@ async def export_settings(
     summary="Importar configuración",
     description="Importa configuración desde JSON"
 )
-async def import_settings(
+def import_settings(
     data: dict,
     service: SettingsService = Depends(get_settings_service)
 ) -> Settings:
@@ -3,7 +3,8 @@ Router de Cronómetro - Endpoints API para gestión de laps.
 Todos los endpoints usan StopwatchService con lista circular doble.
 """
 
-from fastapi import APIRouter, HTTPException, status, Query, Depends
+from fastapi import APIRouter, HTTPException, status, Path, Query, Depends
+from functools import lru_cache
 from typing import Optional
 
 from app.models.lap import Lap, LapCreate, LapStatistics
@@ -22,13 +23,27 @@ router = APIRouter(
 )
 
 
+# ============================================================================
+# PLANTILLAS DE ERROR
+# ============================================================================
+
+# Precomputadas a nivel de módulo: cada 404 solo hace un .format()
+LAP_NOT_FOUND = "Lap con ID {} no encontrado"
+LAP_NUMBER_NOT_FOUND = "Lap número {} no encontrado"
+
+
 # ============================================================================
 # DEPENDENCY INJECTION
 # ============================================================================
 
+@lru_cache()
 def get_stopwatch_service() -> StopwatchService:
     """
-    Dependency para obtener instancia del servicio de cronómetro.
+    Dependency para obtener el servicio de cronómetro.
+    
+    Singleton: todos los requests comparten la misma instancia, así los
+    agregados y la vista memoizada de laps sobreviven entre requests en
+    vez de recargar el JSON cada vez.
     """
     return StopwatchService()
 
@@ -50,18 +65,14 @@ async def create_lap(
 ) -> Lap:
     """
     Agrega un nuevo lap al cronómetro.
+    
+    Los datos inválidos (ValueError) los convierte en 400 el manejador
+    global de excepciones de la app.
     """
-    try:
-        lap = service.add_lap(
-            lap_time=lap_data.lap_time,
-            total_time=lap_data.total_time
-        )
-        return lap
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Error agregando lap: {str(e)}"
-        )
+    return service.add_lap(
+        lap_time=lap_data.lap_time,
+        total_time=lap_data.total_time
+    )
 
 
 @router.get(
@@ -99,57 +110,6 @@ async def clear_laps(
     }
 
 
-@router.get(
-    "/laps/{lap_id}",
-    response_model=Lap,
-    summary="Obtener lap",
-    description="Obtiene un lap específico por su ID"
-)
-async def get_lap(
-    lap_id: int,
-    service: StopwatchService = Depends(get_stopwatch_service)
-) -> Lap:
-    """
-    Obtiene un lap por su ID.
-    """
-    lap = service.get_lap_by_id(lap_id)
-    
-    if not lap:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Lap con ID {lap_id} no encontrado"
-        )
-    
-    return lap
-
-
-@router.delete(
-    "/laps/{lap_id}",
-    status_code=status.HTTP_200_OK,
-    summary="Eliminar lap",
-    description="Elimina un lap específico"
-)
-async def delete_lap(
-    lap_id: int,
-    service: StopwatchService = Depends(get_stopwatch_service)
-) -> dict:
-    """
-    Elimina un lap específico.
-    """
-    deleted = service.delete_lap(lap_id)
-    
-    if not deleted:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Lap con ID {lap_id} no encontrado"
-        )
-    
-    return {
-        "message": "Lap deleted",
-        "lap_id": lap_id
-    }
-
-
 @router.get(
     "/laps/fastest",
     response_model=Optional[Lap],
@@ -195,37 +155,6 @@ async def get_lap_statistics(
     return service.get_statistics()
 
 
-@router.get(
-    "/laps/{lap_number}/navigate",
-    response_model=Lap,
-    summary="Navegar entre laps",
-    description="Navega circularmente entre laps (siguiente o anterior)"
-)
-async def navigate_lap(
-    lap_number: int,
-    direction: str = Query(..., regex="^(next|prev)$", description="Dirección: 'next' o 'prev'"),
-    service: StopwatchService = Depends(get_stopwatch_service)
-) -> Lap:
-    """
-    Navega circularmente entre laps.
-    """
-    if direction not in ["next", "prev"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Direction debe ser 'next' o 'prev'"
-        )
-    
-    lap = service.navigate_lap(lap_number, direction)
-    
-    if not lap:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Lap número {lap_number} no encontrado"
-        )
-    
-    return lap
-
-
 @router.get(
     "/laps/first",
     response_model=Optional[Lap],
@@ -288,6 +217,91 @@ async def get_laps_slower_than(
     return service.get_laps_slower_than(time)
 
 
+# ============================================================================
+# ENDPOINTS CON PARÁMETROS DINÁMICOS - AL FINAL
+# ============================================================================
+
+# ⚠️ IMPORTANTE: /laps/{lap_id} debe ir DESPUÉS de las rutas estáticas
+# (/laps/fastest, /laps/statistics, etc.) para no capturarlas
+
+@router.get(
+    "/laps/{lap_id}",
+    response_model=Lap,
+    summary="Obtener lap",
+    description="Obtiene un lap específico por su ID"
+)
+async def get_lap(
+    lap_id: int = Path(..., ge=1, description="ID del lap"),
+    service: StopwatchService = Depends(get_stopwatch_service)
+) -> Lap:
+    """
+    Obtiene un lap por su ID.
+    """
+    lap = service.get_lap_by_id(lap_id)
+    
+    if not lap:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=LAP_NOT_FOUND.format(lap_id)
+        )
+    
+    return lap
+
+
+@router.delete(
+    "/laps/{lap_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Eliminar lap",
+    description="Elimina un lap específico"
+)
+async def delete_lap(
+    lap_id: int = Path(..., ge=1, description="ID del lap"),
+    service: StopwatchService = Depends(get_stopwatch_service)
+) -> dict:
+    """
+    Elimina un lap específico.
+    """
+    deleted = service.delete_lap(lap_id)
+    
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=LAP_NOT_FOUND.format(lap_id)
+        )
+    
+    return {
+        "message": "Lap deleted",
+        "lap_id": lap_id
+    }
+
+
+@router.get(
+    "/laps/{lap_number}/navigate",
+    response_model=Lap,
+    summary="Navegar entre laps",
+    description="Navega circularmente entre laps (siguiente o anterior)"
+)
+async def navigate_lap(
+    lap_number: int = Path(..., ge=1, description="Número del lap"),
+    direction: str = Query(..., regex="^(next|prev)$", description="Dirección: 'next' o 'prev'"),
+    service: StopwatchService = Depends(get_stopwatch_service)
+) -> Lap:
+    """
+    Navega circularmente entre laps.
+    
+    La validación de direction ya la hace el Query regex.
+    """
+    lap = service.navigate_lap(lap_number, direction)
+    
+    if not lap:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=LAP_NUMBER_NOT_FOUND.format(lap_number)
+        )
+    
+    return lap
+
+
 @router.get(
     "/stats/summary",
     summary="Resumen de estadísticas",
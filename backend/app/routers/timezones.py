@@ -3,7 +3,8 @@ Router de Zonas Horarias - CORREGIDO: Orden de endpoints arreglado.
 El problema era que /{timezone_id} capturaba /favorites antes.
 """
 
-from fastapi import APIRouter, HTTPException, status, Query, Body, Depends
+from fastapi import APIRouter, HTTPException, status, Query, Body, Depends, Request, Response
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -23,12 +24,29 @@ router = APIRouter(
 )
 
 
+# ============================================================================
+# PLANTILLAS DE ERROR
+# ============================================================================
+
+# Precomputadas a nivel de módulo: cada error solo hace un .format()
+TZ_NOT_FOUND = "Zona horaria '{}' no encontrada"
+TZ_ALREADY_FAVORITE = "Zona horaria '{}' ya está en favoritos"
+TZ_NOT_FAVORITE = "Zona horaria '{}' no está en favoritos"
+
+
 # ============================================================================
 # DEPENDENCY INJECTION
 # ============================================================================
 
+@lru_cache()
 def get_timezone_service() -> TimezoneService:
-    """Dependency para obtener instancia del servicio de zonas horarias."""
+    """
+    Dependency para obtener instancia del servicio de zonas horarias.
+    
+    Singleton (@lru_cache): todos los requests comparten la misma
+    instancia, de modo que el caché de zonas y el lock de refresh
+    realmente coalescen llamadas concurrentes.
+    """
     return TimezoneService()
 
 
@@ -46,11 +64,27 @@ def get_timezone_service() -> TimezoneService:
     description="Obtiene todas las zonas horarias disponibles"
 )
 async def get_timezones(
+    request: Request,
+    response: Response,
     refresh: bool = Query(False, description="Forzar refresh desde la API"),
     service: TimezoneService = Depends(get_timezone_service)
 ) -> list[Timezone]:
-    """Obtiene todas las zonas horarias disponibles."""
-    return service.get_available_timezones(force_refresh=refresh)
+    """
+    Obtiene todas las zonas horarias disponibles.
+    
+    El catálogo cambia solo con un refresh exitoso, así que se expone un
+    ETag por versión: si el cliente ya tiene la versión actual se
+    responde 304 sin serializar la lista completa.
+    """
+    timezones = service.get_available_timezones(force_refresh=refresh)
+    
+    etag = f'W/"tz-catalog-{service.get_catalog_version()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return timezones
 
 
 @router.get(
@@ -74,9 +108,21 @@ async def search_timezones(
     description="Obtiene lista de países únicos disponibles"
 )
 async def get_countries(
+    request: Request,
+    response: Response,
     service: TimezoneService = Depends(get_timezone_service)
 ) -> list[str]:
-    """Obtiene lista de países únicos con zonas horarias disponibles."""
+    """
+    Obtiene lista de países únicos con zonas horarias disponibles.
+    
+    Cacheable igual que el catálogo: mismo versionado, mismo 304.
+    """
+    etag = f'W/"tz-countries-{service.get_catalog_version()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "public, max-age=3600"
     return service.get_countries()
 
 
@@ -163,22 +209,20 @@ async def add_favorite(
     service: TimezoneService = Depends(get_timezone_service)
 ) -> FavoriteTimezone:
     """Agrega una zona horaria a favoritos."""
-    favorite = service.add_favorite(timezone_id)
-    
-    if not favorite:
-        tz = service.get_timezone_by_id(timezone_id)
-        if not tz:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Zona horaria '{timezone_id}' no encontrada"
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Zona horaria '{timezone_id}' ya está en favoritos"
-            )
-    
-    return favorite
+    # El servicio distingue la causa del fallo con excepciones tipadas,
+    # así no hay que volver a buscar la zona para armar el error
+    try:
+        return service.add_favorite(timezone_id)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=TZ_NOT_FOUND.format(timezone_id)
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=TZ_ALREADY_FAVORITE.format(timezone_id)
+        )
 
 
 @router.put(
@@ -246,7 +290,7 @@ async def remove_favorite(
     if not removed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Zona horaria '{timezone_id}' no está en favoritos"
+            detail=TZ_NOT_FAVORITE.format(timezone_id)
         )
     
     return {
@@ -266,19 +310,16 @@ async def navigate_favorites(
     direction: str = Query(..., regex="^(next|prev)$", description="Dirección: 'next' o 'prev'"),
     service: TimezoneService = Depends(get_timezone_service)
 ) -> FavoriteTimezone:
-    """Navega circularmente entre favoritos."""
-    if direction not in ["next", "prev"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Direction debe ser 'next' o 'prev'"
-        )
+    """Navega circularmente entre favoritos.
     
+    La validación de direction ya la hace el Query regex.
+    """
     favorite = service.navigate_favorites(timezone_id, direction)
     
     if not favorite:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Zona horaria '{timezone_id}' no está en favoritos"
+            detail=TZ_NOT_FAVORITE.format(timezone_id)
         )
     
     return favorite
@@ -317,7 +358,7 @@ async def get_current_time(
     if not timezone:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Zona horaria '{timezone_id}' no encontrada"
+            detail=TZ_NOT_FOUND.format(timezone_id)
         )
     
     utc_now = datetime.utcnow()
@@ -353,7 +394,7 @@ async def get_timezone(
     if not timezone:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Zona horaria '{timezone_id}' no encontrada"
+            detail=TZ_NOT_FOUND.format(timezone_id)
         )
     
     return timezone
\ No newline at end of file
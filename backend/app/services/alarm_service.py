@@ -3,17 +3,24 @@ Servicio de gestión de alarmas usando Lista Circular Doble.
 Implementa toda la lógica de negocio para el sistema de alarmas.
 """
 
+import bisect
+import threading
 from datetime import datetime
 from typing import Optional
 import logging
 
 from app.data_structures.circular_doubly_linked_list import CircularDoublyLinkedList
-from app.models.alarm import Alarm, AlarmCreate, AlarmUpdate
+from app.data_structures.node import Node
+from app.models.alarm import Alarm, AlarmCreate, AlarmUpdate, VALID_DAYS
 from app.database.json_db import JSONDatabase
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Resuelto una sola vez al importar: la ruta no cambia durante la vida
+# del proceso y evita el lookup de configuración por instancia
+_ALARMS_FILE = get_settings().ALARMS_FILE
+
 
 class AlarmService:
     """
@@ -27,14 +34,38 @@ class AlarmService:
     Attributes:
         alarms: Lista circular doble de alarmas
         json_db: Base de datos JSON para persistencia
+        _ordered: Espejo ordenado por hora de la lista circular; permite
+                  localizar posiciones de inserción con bisect en O(log n)
+        _nodes: Índice id -> nodo para enlazar inserciones en O(1)
     """
     
     def __init__(self):
         """Inicializa el servicio y carga alarmas desde JSON."""
         self.alarms = CircularDoublyLinkedList[Alarm]()
-        settings = get_settings()
-        self.json_db = JSONDatabase(settings.ALARMS_FILE)
-        self._load_from_json()
+        self._ordered: list[Alarm] = []
+        self._nodes: dict[int, Node[Alarm]] = {}
+        self._next_id = 1
+        # Cache id -> dict serializado; solo se re-serializa lo que cambió
+        self._dump_cache: dict[int, dict] = {}
+        # Horario de alarmas activas ordenado por hora; se construye
+        # perezosamente y se invalida ante cualquier mutación
+        self._active_schedule: Optional[list[Alarm]] = None
+        # Claves enteras paralelas al horario activo, para bisect directo
+        # sobre ints sin callback por comparación
+        self._active_keys: list[int] = []
+        # Índice día -> alarmas de ese día (incluye las de "una vez"),
+        # también perezoso e invalidado junto con el horario
+        self._by_day: Optional[dict[str, list[Alarm]]] = None
+        # Clave de orden entera (minuto del día) por ID: comparar ints en
+        # sorts y bisects es mucho más barato que comparar strings "HH:MM"
+        self._time_keys: dict[int, int] = {}
+        # Serializa el acceso cuando el servicio se comparte entre hilos
+        # (FastAPI puede despachar handlers en varios workers)
+        self._lock = threading.RLock()
+        self.json_db = JSONDatabase(_ALARMS_FILE)
+        # Carga perezosa: el JSON se lee recién en el primer acceso real,
+        # no al construir el servicio
+        self._loaded = False
         logger.info("AlarmService inicializado")
     
     # ========================================================================
@@ -54,27 +85,29 @@ class AlarmService:
         Returns:
             Alarm: Alarma creada
         """
-        # Generar nuevo ID
-        new_id = self._generate_id()
-        
-        # Crear objeto Alarm
-        alarm = Alarm(
-            id=new_id,
-            time=alarm_data.time,
-            label=alarm_data.label,
-            enabled=alarm_data.enabled,
-            days=alarm_data.days,
-            created_at=datetime.now()
-        )
-        
-        # Insertar en lista ordenada por hora
-        self.alarms.insert_sorted(alarm, key_func=self._alarm_sort_key)
-        
-        # Persistir
-        self._save_to_json()
+        self._ensure_loaded()
+        with self._lock:
+            # Generar nuevo ID
+            new_id = self._generate_id()
+        
+            # Crear objeto Alarm
+            alarm = Alarm(
+                id=new_id,
+                time=alarm_data.time,
+                label=alarm_data.label,
+                enabled=alarm_data.enabled,
+                days=alarm_data.days,
+                created_at=datetime.now()
+            )
+        
+            # Insertar en lista ordenada por hora
+            self._insert_sorted(alarm)
+        
+            # Persistir
+            self._save_to_json()
         
-        logger.info(f"Alarma creada: ID={alarm.id}, hora={alarm.time}")
-        return alarm
+            logger.info(f"Alarma creada: ID={alarm.id}, hora={alarm.time}")
+            return alarm
     
     def get_all_alarms(self) -> list[Alarm]:
         """
@@ -83,7 +116,8 @@ class AlarmService:
         Returns:
             list[Alarm]: Lista de todas las alarmas
         """
-        return self.alarms.get_all()
+        self._ensure_loaded()
+        return list(self._ordered)
     
     def get_alarm_by_id(self, alarm_id: int) -> Optional[Alarm]:
         """
@@ -95,7 +129,9 @@ class AlarmService:
         Returns:
             Alarm | None: Alarma encontrada o None
         """
-        node = self.alarms.find(lambda a: a.id == alarm_id)
+        self._ensure_loaded()
+        # Lookup O(1) en el índice id -> nodo, sin recorrer la lista
+        node = self._nodes.get(alarm_id)
         return node.data if node else None
     
     def update_alarm(self, alarm_id: int, update_data: AlarmUpdate) -> Optional[Alarm]:
@@ -111,37 +147,46 @@ class AlarmService:
         Returns:
             Alarm | None: Alarma actualizada o None si no existe
         """
-        # Buscar alarma
-        alarm = self.get_alarm_by_id(alarm_id)
-        if not alarm:
-            logger.warning(f"Alarma no encontrada: ID={alarm_id}")
-            return None
-        
-        # Guardar hora anterior para detectar cambios
-        old_time = alarm.time
-        
-        # Actualizar campos proporcionados
-        if update_data.time is not None:
-            alarm.time = update_data.time
-        if update_data.label is not None:
-            alarm.label = update_data.label
-        if update_data.enabled is not None:
-            alarm.enabled = update_data.enabled
-        if update_data.days is not None:
-            alarm.days = update_data.days
-        
-        # Si cambió la hora, reordenar en la lista
-        if update_data.time is not None and update_data.time != old_time:
-            # Eliminar y reinsertar para mantener orden
-            self.alarms.delete(alarm)
-            self.alarms.insert_sorted(alarm, key_func=self._alarm_sort_key)
-            logger.info(f"Alarma reordenada: ID={alarm_id}, {old_time} -> {alarm.time}")
-        
-        # Persistir cambios
-        self._save_to_json()
+        self._ensure_loaded()
+        with self._lock:
+            # Buscar alarma
+            alarm = self.get_alarm_by_id(alarm_id)
+            if not alarm:
+                logger.warning(f"Alarma no encontrada: ID={alarm_id}")
+                return None
+        
+            # Detectar cambio de hora antes de mutar
+            old_time = alarm.time
+            time_changed = update_data.time is not None and update_data.time != old_time
+        
+            # Si cambia la hora, sacar la alarma ANTES de modificarla: su
+            # posición en el espejo ordenado se localiza por la clave actual
+            if time_changed:
+                self._remove_sorted(alarm)
+        
+            # Actualizar campos proporcionados
+            if update_data.time is not None:
+                alarm.time = update_data.time
+            if update_data.label is not None:
+                alarm.label = update_data.label
+            if update_data.enabled is not None:
+                alarm.enabled = update_data.enabled
+            if update_data.days is not None:
+                alarm.days = update_data.days
+        
+            # Reinsertar ya con la nueva hora
+            if time_changed:
+                self._insert_sorted(alarm)
+                logger.info(f"Alarma reordenada: ID={alarm_id}, {old_time} -> {alarm.time}")
+        
+            # Invalidar caches derivados de esta alarma y persistir
+            self._dump_cache.pop(alarm_id, None)
+            self._active_schedule = None
+            self._by_day = None
+            self._save_to_json()
         
-        logger.info(f"Alarma actualizada: ID={alarm_id}")
-        return alarm
+            logger.info(f"Alarma actualizada: ID={alarm_id}")
+            return alarm
     
     def delete_alarm(self, alarm_id: int) -> bool:
         """
@@ -153,21 +198,23 @@ class AlarmService:
         Returns:
             bool: True si se eliminó, False si no existía
         """
-        # Buscar alarma
-        alarm = self.get_alarm_by_id(alarm_id)
-        if not alarm:
-            logger.warning(f"Alarma no encontrada para eliminar: ID={alarm_id}")
-            return False
+        self._ensure_loaded()
+        with self._lock:
+            # Buscar alarma
+            alarm = self.get_alarm_by_id(alarm_id)
+            if not alarm:
+                logger.warning(f"Alarma no encontrada para eliminar: ID={alarm_id}")
+                return False
         
-        # Eliminar de la lista circular
-        deleted = self.alarms.delete(alarm)
+            # Eliminar de la lista circular y del espejo ordenado
+            deleted = self._remove_sorted(alarm)
         
-        if deleted:
-            # Persistir cambios
-            self._save_to_json()
-            logger.info(f"Alarma eliminada: ID={alarm_id}")
+            if deleted:
+                # Persistir cambios
+                self._save_to_json()
+                logger.info(f"Alarma eliminada: ID={alarm_id}")
         
-        return deleted
+            return deleted
     
     def toggle_alarm(self, alarm_id: int) -> Optional[Alarm]:
         """
@@ -179,20 +226,25 @@ class AlarmService:
         Returns:
             Alarm | None: Alarma actualizada o None si no existe
         """
-        alarm = self.get_alarm_by_id(alarm_id)
-        if not alarm:
-            return None
-        
-        # Cambiar estado
-        alarm.enabled = not alarm.enabled
-        
-        # Persistir
-        self._save_to_json()
+        self._ensure_loaded()
+        with self._lock:
+            alarm = self.get_alarm_by_id(alarm_id)
+            if not alarm:
+                return None
+        
+            # Cambiar estado
+            alarm.enabled = not alarm.enabled
+        
+            # Invalidar caches derivados de esta alarma y persistir
+            self._dump_cache.pop(alarm_id, None)
+            self._active_schedule = None
+            self._by_day = None
+            self._save_to_json()
         
-        status = "activada" if alarm.enabled else "desactivada"
-        logger.info(f"Alarma {status}: ID={alarm_id}")
+            status = "activada" if alarm.enabled else "desactivada"
+            logger.info(f"Alarma {status}: ID={alarm_id}")
         
-        return alarm
+            return alarm
     
     # ========================================================================
     # MÉTODOS DE NAVEGACIÓN CIRCULAR
@@ -207,29 +259,22 @@ class AlarmService:
         Returns:
             Alarm | None: Próxima alarma activa o None si no hay
         """
-        if self.alarms.is_empty():
-            return None
-        
-        # Obtener hora actual en formato HH:MM
-        now = datetime.now()
-        current_time = now.strftime("%H:%M")
-        
-        # Buscar primera alarma activa después de la hora actual
-        all_alarms = self.get_all_alarms()
-        
-        # Primero buscar alarmas después de la hora actual
-        for alarm in all_alarms:
-            if alarm.enabled and alarm.time > current_time:
-                return alarm
-        
-        # Si no hay ninguna después, la primera alarma del día siguiente
-        # (circularidad: después de 23:59 viene 00:00)
-        for alarm in all_alarms:
-            if alarm.enabled:
-                return alarm
-        
-        # No hay alarmas activas
-        return None
+        self._ensure_loaded()
+        with self._lock:
+            schedule = self._get_active_schedule()
+            if not schedule:
+                # No hay alarmas activas
+                return None
+        
+            # Minuto del día actual, sin strftime ni strings
+            now = datetime.now()
+            current_key = now.hour * 60 + now.minute
+        
+            # Primera alarma activa después de la hora actual; bisect sobre la
+            # lista de ints paralela (sin callback por comparación) y módulo
+            # para la circularidad (después de 23:59 viene la del día siguiente)
+            idx = bisect.bisect_right(self._active_keys, current_key)
+            return schedule[idx % len(schedule)]
     
     def navigate_alarm(self, alarm_id: int, direction: str) -> Optional[Alarm]:
         """
@@ -242,21 +287,21 @@ class AlarmService:
         Returns:
             Alarm | None: Siguiente/anterior alarma o None
         """
-        # Buscar alarma actual
-        alarm = self.get_alarm_by_id(alarm_id)
-        if not alarm:
+        self._ensure_loaded()
+        # Ir directo al nodo por el índice: navegar es seguir un puntero,
+        # sin recorrer la lista buscando la alarma actual
+        node = self._nodes.get(alarm_id)
+        if node is None:
             return None
         
         # Navegar según dirección
         if direction == "next":
-            next_data = self.alarms.get_next(alarm)
+            return node.next.data
         elif direction == "prev":
-            next_data = self.alarms.get_previous(alarm)
-        else:
-            logger.warning(f"Dirección inválida: {direction}")
-            return None
+            return node.prev.data
         
-        return next_data
+        logger.warning(f"Dirección inválida: {direction}")
+        return None
     
     # ========================================================================
     # MÉTODOS DE CONSULTA
@@ -269,7 +314,9 @@ class AlarmService:
         Returns:
             list[Alarm]: Lista de alarmas habilitadas
         """
-        return self.alarms.find_all(lambda a: a.enabled)
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._get_active_schedule())
     
     def get_alarms_by_day(self, day: str) -> list[Alarm]:
         """
@@ -281,7 +328,19 @@ class AlarmService:
         Returns:
             list[Alarm]: Alarmas de ese día
         """
-        return self.alarms.find_all(lambda a: day in a.days or not a.days)
+        self._ensure_loaded()
+        with self._lock:
+            if self._by_day is None:
+                # Construir el índice una vez; cada alarma se anota en sus
+                # días (o en todos, si es de "una vez"). Partir de _ordered
+                # mantiene cada lista en orden por hora.
+                by_day: dict[str, list[Alarm]] = {d: [] for d in VALID_DAYS}
+                for alarm in self._ordered:
+                    for d in (alarm.days or VALID_DAYS):
+                        by_day[d].append(alarm)
+                self._by_day = by_day
+        
+            return list(self._by_day.get(day, []))
     
     def count_alarms(self) -> int:
         """
@@ -290,7 +349,9 @@ class AlarmService:
         Returns:
             int: Cantidad de alarmas
         """
-        return len(self.alarms)
+        self._ensure_loaded()
+        # len() sobre el espejo: evita el recorrido que hace size()
+        return len(self._ordered)
     
     def count_active_alarms(self) -> int:
         """
@@ -299,59 +360,206 @@ class AlarmService:
         Returns:
             int: Cantidad de alarmas habilitadas
         """
-        return len(self.get_active_alarms())
+        self._ensure_loaded()
+        with self._lock:
+            return len(self._get_active_schedule())
     
     # ========================================================================
     # MÉTODOS PRIVADOS - PERSISTENCIA Y AUXILIARES
     # ========================================================================
     
+    def _ensure_loaded(self) -> None:
+        """Carga las alarmas desde JSON la primera vez que se necesitan."""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load_from_json()
+                    self._loaded = True
+    
     def _load_from_json(self) -> None:
         """Carga alarmas desde el archivo JSON."""
         data = self.json_db.read_as_list()
         
+        loaded: list[Alarm] = []
         for item in data:
             try:
-                alarm = Alarm(**item)
-                # Insertar en orden
-                self.alarms.insert_sorted(alarm, key_func=self._alarm_sort_key)
+                # model_construct omite la validación de Pydantic: estos
+                # datos los escribimos nosotros mismos y ya son válidos
+                loaded.append(Alarm.model_construct(
+                    id=item["id"],
+                    time=item["time"],
+                    label=item["label"],
+                    enabled=item.get("enabled", True),
+                    days=item.get("days", []),
+                    created_at=datetime.fromisoformat(item["created_at"]),
+                ))
             except Exception as e:
                 logger.error(f"Error cargando alarma: {e}")
         
+        # Ordenar una sola vez (Timsort en C) y construir la lista circular
+        # en una sola pasada, en vez de una inserción por alarma
+        loaded.sort(key=self._alarm_sort_key)
+        nodes = self.alarms.extend(loaded)
+        for alarm, node in zip(loaded, nodes):
+            self._nodes[alarm.id] = node
+            # Mantener el contador de IDs por encima de todo lo cargado
+            self._next_id = max(self._next_id, alarm.id + 1)
+        self._ordered = loaded
+        
         logger.info(f"Cargadas {len(self.alarms)} alarmas desde JSON")
     
     def _save_to_json(self) -> None:
-        """Guarda el estado actual de alarmas en JSON."""
-        data = [alarm.model_dump(mode='json') for alarm in self.get_all_alarms()]
-        self.json_db.write(data)
-        logger.debug(f"Guardadas {len(data)} alarmas en JSON")
+        """
+        Programa el guardado de alarmas en JSON.
+        
+        La escritura es diferida y coalescida: una ráfaga de mutaciones
+        (crear/editar/toggle seguidos) produce una sola escritura con el
+        estado final en vez de reescribir el archivo por cada cambio.
+        """
+        self.json_db.write_delayed(self._dump_alarms)
+    
+    def _dump_alarms(self) -> list[dict]:
+        """
+        Serializa todas las alarmas a dicts listos para JSON.
+        
+        Reutiliza los dicts cacheados por ID: solo las alarmas cuyo cache
+        fue invalidado (creadas o modificadas desde el último guardado)
+        pasan por model_dump, así guardar cuesta O(cambios) en Pydantic
+        en vez de O(n).
+        """
+        result = []
+        for alarm in self._ordered:
+            data = self._dump_cache.get(alarm.id)
+            if data is None:
+                data = alarm.model_dump(mode='json')
+                self._dump_cache[alarm.id] = data
+            result.append(data)
+        return result
     
     def _generate_id(self) -> int:
         """
         Genera un nuevo ID único para una alarma.
         
+        Usa un contador monotónico inicializado en _load_from_json, en vez
+        de recorrer todas las alarmas buscando el máximo en cada creación.
+        
         Returns:
             int: Nuevo ID
         """
-        if self.alarms.is_empty():
-            return 1
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
+    
+    def _get_active_schedule(self) -> list[Alarm]:
+        """
+        Retorna el horario de alarmas activas, reconstruyéndolo si hace falta.
+        
+        Returns:
+            list[Alarm]: Alarmas habilitadas en orden por hora
+        """
+        if self._active_schedule is None:
+            self._active_schedule = [a for a in self._ordered if a.enabled]
+            self._active_keys = [
+                self._alarm_sort_key(a) for a in self._active_schedule
+            ]
+        return self._active_schedule
+    
+    def _insert_sorted(self, alarm: Alarm) -> None:
+        """
+        Inserta una alarma manteniendo el orden por hora.
+        
+        Localiza la posición con bisect sobre el espejo ordenado (O(log n)
+        comparaciones) y enlaza el nodo en O(1) usando el índice de nodos,
+        en lugar de recorrer la lista circular.
+        
+        Args:
+            alarm: Alarma a insertar
+        """
+        # Registrar/refrescar la clave entera antes de ubicar la posición
+        self._time_keys[alarm.id] = self._time_to_key(alarm.time)
         
-        # Obtener el ID máximo actual
-        all_alarms = self.get_all_alarms()
-        max_id = max(alarm.id for alarm in all_alarms)
-        return max_id + 1
+        i = bisect.bisect_right(
+            self._ordered, self._time_keys[alarm.id], key=self._alarm_sort_key
+        )
+        self._ordered.insert(i, alarm)
+        self._active_schedule = None
+        self._by_day = None
+        
+        if i + 1 < len(self._ordered):
+            # Hay un sucesor: insertar justo antes de su nodo
+            successor = self._ordered[i + 1]
+            node = self.alarms.insert_before_node(self._nodes[successor.id], alarm)
+        else:
+            node = self.alarms.insert_at_end(alarm)
+        
+        self._nodes[alarm.id] = node
+    
+    def _remove_sorted(self, alarm: Alarm) -> bool:
+        """
+        Elimina una alarma de la lista circular y del espejo ordenado.
+        
+        Args:
+            alarm: Alarma a eliminar
+            
+        Returns:
+            bool: True si se eliminó
+        """
+        node = self._nodes.pop(alarm.id, None)
+        if node is None:
+            return False
+        
+        # Desenlazar en O(1) con el nodo del índice, sin buscar el dato
+        self.alarms.remove_node(node)
+        
+        # Localizar la posición en el espejo con bisect y avanzar por
+        # identidad entre horas duplicadas: evita el scan con __eq__ de
+        # Pydantic que haría list.remove
+        i = bisect.bisect_left(
+            self._ordered, self._alarm_sort_key(alarm), key=self._alarm_sort_key
+        )
+        while i < len(self._ordered) and self._ordered[i] is not alarm:
+            i += 1
+        if i < len(self._ordered):
+            del self._ordered[i]
+        
+        self._time_keys.pop(alarm.id, None)
+        self._dump_cache.pop(alarm.id, None)
+        self._active_schedule = None
+        self._by_day = None
+        return True
     
     @staticmethod
-    def _alarm_sort_key(alarm: Alarm) -> str:
+    def _time_to_key(time_str: str) -> int:
+        """
+        Convierte "HH:MM" al minuto del día (0-1439).
+        
+        Args:
+            time_str: Hora en formato HH:MM
+            
+        Returns:
+            int: Minuto del día
+        """
+        hours, _, minutes = time_str.partition(':')
+        return int(hours) * 60 + int(minutes)
+    
+    def _alarm_sort_key(self, alarm: Alarm) -> int:
         """
         Función clave para ordenar alarmas por hora.
         
+        Usa la clave entera cacheada por ID (minuto del día); comparar
+        ints evita la comparación carácter a carácter de los "HH:MM".
+        
         Args:
             alarm: Alarma a evaluar
             
         Returns:
-            str: Hora de la alarma (formato HH:MM)
+            int: Minuto del día de la alarma
         """
-        return alarm.time
+        key = self._time_keys.get(alarm.id)
+        if key is None:
+            key = self._time_to_key(alarm.time)
+            self._time_keys[alarm.id] = key
+        return key
 
 
 # ============================================================================
@@ -12,6 +12,9 @@ from app.config import get_settings as get_app_settings
 
 logger = logging.getLogger(__name__)
 
+# Resuelto una sola vez al importar (ver nota equivalente en alarm_service)
+_SETTINGS_FILE = get_app_settings().SETTINGS_FILE
+
 
 class SettingsService:
     """
@@ -26,9 +29,10 @@ class SettingsService:
     
     def __init__(self):
         """Inicializa el servicio y carga configuración desde JSON."""
-        app_settings = get_app_settings()
-        self.json_db = JSONDatabase(app_settings.SETTINGS_FILE)
+        self.json_db = JSONDatabase(_SETTINGS_FILE)
         self.settings = self._load_from_json()
+        # Respuesta pre-construida para GET /settings; se invalida al mutar
+        self._cached_response: Optional[SettingsResponse] = None
         logger.info("SettingsService inicializado")
     
     # ========================================================================
@@ -51,12 +55,16 @@ class SettingsService:
         Returns:
             SettingsResponse: Configuración con opciones disponibles
         """
-        return SettingsResponse(
-            time_format=self.settings.time_format,
-            alarm_sound=self.settings.alarm_sound,
-            alarm_volume=self.settings.alarm_volume,
-            theme=self.settings.theme,
-        )
+        # Reutilizar la respuesta construida: GET /settings es frecuente
+        # y la configuración cambia rara vez
+        if self._cached_response is None:
+            self._cached_response = SettingsResponse(
+                time_format=self.settings.time_format,
+                alarm_sound=self.settings.alarm_sound,
+                alarm_volume=self.settings.alarm_volume,
+                theme=self.settings.theme,
+            )
+        return self._cached_response
     
     def update_settings(self, update_data: SettingsUpdate) -> Settings:
         """
@@ -75,27 +83,40 @@ class SettingsService:
             logger.warning("No hay cambios en la configuración")
             return self.settings
         
-        # Actualizar solo campos proporcionados
-        if update_data.time_format is not None:
+        # Actualizar solo campos cuyo valor realmente cambia: un frontend
+        # que reenvía el objeto completo no debe provocar escrituras
+        changed = False
+        
+        if (update_data.time_format is not None
+                and update_data.time_format != self.settings.time_format):
             self.settings.time_format = update_data.time_format
+            changed = True
             logger.info(f"Formato de hora actualizado: {update_data.time_format}")
         
-        if update_data.alarm_sound is not None:
+        if (update_data.alarm_sound is not None
+                and update_data.alarm_sound != self.settings.alarm_sound):
             self.settings.alarm_sound = update_data.alarm_sound
+            changed = True
             logger.info(f"Sonido de alarma actualizado: {update_data.alarm_sound}")
         
-        if update_data.alarm_volume is not None:
+        if (update_data.alarm_volume is not None
+                and update_data.alarm_volume != self.settings.alarm_volume):
             self.settings.alarm_volume = update_data.alarm_volume
+            changed = True
             logger.info(f"Volumen actualizado: {update_data.alarm_volume}%")
         
-        if update_data.theme is not None:
+        if (update_data.theme is not None
+                and update_data.theme != self.settings.theme):
             self.settings.theme = update_data.theme
+            changed = True
             logger.info(f"Tema actualizado: {update_data.theme}")
         
-        # Persistir cambios
-        self._save_to_json()
+        # Persistir solo si algo cambió de verdad
+        if changed:
+            self._cached_response = None
+            self._save_to_json()
+            logger.info("Configuración actualizada exitosamente")
         
-        logger.info("Configuración actualizada exitosamente")
         return self.settings
     
     def reset_to_defaults(self) -> Settings:
@@ -107,6 +128,7 @@ class SettingsService:
         """
         # Crear configuración por defecto
         self.settings = Settings()
+        self._cached_response = None
         
         # Persistir
         self._save_to_json()
@@ -269,11 +291,18 @@ class SettingsService:
                 # No existe archivo, usar defaults
                 logger.info("No se encontró configuración, usando valores por defecto")
                 settings = Settings()
+                self.settings = settings
                 self._save_to_json()  # Guardar defaults
                 return settings
             
-            # Cargar desde JSON
-            settings = Settings(**data)
+            # Cargar desde JSON; model_construct omite la validación de
+            # Pydantic para datos que escribimos nosotros mismos
+            settings = Settings.model_construct(
+                time_format=data["time_format"],
+                alarm_sound=data["alarm_sound"],
+                alarm_volume=data["alarm_volume"],
+                theme=data["theme"],
+            )
             logger.info("Configuración cargada desde JSON")
             return settings
             
@@ -283,11 +312,16 @@ class SettingsService:
             return Settings()
     
     def _save_to_json(self) -> None:
-        """Guarda la configuración actual en JSON."""
+        """
+        Programa el guardado de la configuración en JSON.
+        
+        Escritura diferida y coalescida: una ráfaga de ticks de volumen
+        (slider) colapsa en una sola escritura con el valor final.
+        """
         try:
-            data = self.settings.model_dump(mode='json')
-            self.json_db.write(data)
-            logger.debug("Configuración guardada en JSON")
+            self.json_db.write_delayed(
+                lambda: self.settings.model_dump(mode='json')
+            )
         except Exception as e:
             logger.error(f"Error guardando configuración: {e}")
     
@@ -314,6 +348,7 @@ class SettingsService:
         """
         try:
             self.settings = Settings(**data)
+            self._cached_response = None
             self._save_to_json()
             logger.info("Configuración importada exitosamente")
             return self.settings
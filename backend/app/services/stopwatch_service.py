@@ -3,11 +3,14 @@ Servicio de gestión de cronómetro y laps usando Lista Circular Doble.
 Implementa la lógica para registrar y navegar entre vueltas del cronómetro.
 """
 
+import math
+from array import array
 from datetime import datetime
 from typing import Optional
 import logging
 
 from app.data_structures.circular_doubly_linked_list import CircularDoublyLinkedList
+from app.data_structures.node import Node
 from app.models.lap import Lap, LapCreate, LapStatistics
 from app.database.json_db import JSONDatabase
 from app.config import get_settings
@@ -29,9 +32,45 @@ class StopwatchService:
         json_db: Base de datos JSON para persistencia
     """
     
-    def __init__(self):
-        """Inicializa el servicio y carga laps desde JSON."""
+    def __init__(self, persist: bool = True):
+        """
+        Inicializa el servicio y carga laps desde JSON.
+        
+        Args:
+            persist: Si False, no escribe a disco (útil para demos y
+                     pruebas: las mutaciones quedan solo en memoria)
+        """
+        self._persist = persist
         self.laps = CircularDoublyLinkedList[Lap]()
+        # Índices lap_number -> nodo e id -> nodo para acceso O(1) sin
+        # recorrer la lista
+        self._number_index: dict[int, Node[Lap]] = {}
+        self._id_index: dict[int, Node[Lap]] = {}
+        # Agregados incrementales: evitan recorrer todos los laps en cada
+        # consulta de estadísticas
+        self._count = 0
+        self._time_sum = 0.0
+        self._fastest: Optional[Lap] = None
+        self._slowest: Optional[Lap] = None
+        # Contadores monotónicos, sembrados al cargar: generar ID/número
+        # es O(1) en vez de buscar el máximo en todos los laps
+        self._next_id = 1
+        self._next_lap_number = 1
+        # Vista lista memoizada por versión de la lista circular
+        self._laps_cache: Optional[list[Lap]] = None
+        self._laps_cache_version = -1
+        # Columna numérica contigua (paralela a la vista) para que los
+        # escaneos de tiempos corran en bucles C sobre memoria contigua
+        # en vez de perseguir punteros de nodos
+        self._times_cache: Optional[array] = None
+        self._times_cache_version = -1
+        # Dicts serializados por ID: los laps son inmutables una vez
+        # creados, así que su forma JSON se calcula una sola vez
+        self._dump_cache: dict[int, dict] = {}
+        # Estadísticas memoizadas por versión: los sondeos del frontend
+        # entre mutaciones devuelven el mismo objeto sin recalcular nada
+        self._stats_cache: Optional[LapStatistics] = None
+        self._stats_cache_version = -1
         settings = get_settings()
         self.json_db = JSONDatabase(settings.LAPS_FILE)
         self._load_from_json()
@@ -58,20 +97,29 @@ class StopwatchService:
         new_id = self._generate_id()
         lap_number = self._get_next_lap_number()
         
-        # Crear objeto Lap
+        # Crear objeto Lap (el validador del modelo ya redondea los
+        # tiempos a 2 decimales; redondear aquí sería trabajo duplicado)
         lap = Lap(
             id=new_id,
             lap_number=lap_number,
-            lap_time=round(lap_time, 2),
-            total_time=round(total_time, 2),
+            lap_time=lap_time,
+            total_time=total_time,
             timestamp=datetime.now()
         )
         
         # Insertar al INICIO (último lap primero)
-        self.laps.insert_at_beginning(lap)
-        
-        # Persistir
-        self._save_to_json()
+        node = self.laps.insert_at_beginning(lap)
+        self._number_index[lap.lap_number] = node
+        self._id_index[lap.id] = node
+        self._update_aggregates_on_add(lap)
+        
+        # Persistir solo el lap nuevo: empalme O(1) al final del array en
+        # disco, en vez de re-serializar todos los laps por cada vuelta.
+        # El mismo dict queda cacheado para futuras reescrituras completas
+        payload = lap.model_dump()
+        self._dump_cache[lap.id] = payload
+        if self._persist:
+            self.json_db.append_to_array(payload)
         
         logger.info(f"Lap agregado: #{lap_number}, tiempo={lap_time:.2f}s")
         return lap
@@ -81,9 +129,13 @@ class StopwatchService:
         Obtiene todos los laps en orden (más reciente primero).
         
         Returns:
-            list[Lap]: Lista de laps
+            list[Lap]: Lista de laps (vista compartida, tratar como solo lectura)
         """
-        return self.laps.get_all()
+        # Reutilizar la vista si la lista no cambió desde la última vez
+        if self._laps_cache_version != self.laps.version:
+            self._laps_cache = self.laps.get_all()
+            self._laps_cache_version = self.laps.version
+        return self._laps_cache
     
     def get_lap_by_id(self, lap_id: int) -> Optional[Lap]:
         """
@@ -95,7 +147,7 @@ class StopwatchService:
         Returns:
             Lap | None: Lap encontrado o None
         """
-        node = self.laps.find(lambda l: l.id == lap_id)
+        node = self._id_index.get(lap_id)
         return node.data if node else None
     
     def get_lap_by_number(self, lap_number: int) -> Optional[Lap]:
@@ -108,7 +160,7 @@ class StopwatchService:
         Returns:
             Lap | None: Lap encontrado o None
         """
-        node = self.laps.find(lambda l: l.lap_number == lap_number)
+        node = self._number_index.get(lap_number)
         return node.data if node else None
     
     # ========================================================================
@@ -122,11 +174,7 @@ class StopwatchService:
         Returns:
             Lap | None: Lap más rápido o None si no hay laps
         """
-        if self.laps.is_empty():
-            return None
-        
-        all_laps = self.get_all_laps()
-        return min(all_laps, key=lambda l: l.lap_time)
+        return self._fastest
     
     def get_slowest_lap(self) -> Optional[Lap]:
         """
@@ -135,11 +183,7 @@ class StopwatchService:
         Returns:
             Lap | None: Lap más lento o None si no hay laps
         """
-        if self.laps.is_empty():
-            return None
-        
-        all_laps = self.get_all_laps()
-        return max(all_laps, key=lambda l: l.lap_time)
+        return self._slowest
     
     def get_average_lap_time(self) -> float:
         """
@@ -148,12 +192,10 @@ class StopwatchService:
         Returns:
             float: Tiempo promedio en segundos
         """
-        if self.laps.is_empty():
+        if self._count == 0:
             return 0.0
         
-        all_laps = self.get_all_laps()
-        total = sum(lap.lap_time for lap in all_laps)
-        return round(total / len(all_laps), 2)
+        return round(self._time_sum / self._count, 2)
     
     def get_statistics(self) -> LapStatistics:
         """
@@ -162,32 +204,32 @@ class StopwatchService:
         Returns:
             LapStatistics: Estadísticas de todos los laps
         """
-        all_laps = self.get_all_laps()
+        # Reutilizar el objeto si la lista no cambió desde el último cálculo
+        if self._stats_cache_version == self.laps.version:
+            return self._stats_cache
         
-        if not all_laps:
-            return LapStatistics(
+        if self._count == 0:
+            stats = LapStatistics(
                 total_laps=0,
                 fastest_lap=None,
                 slowest_lap=None,
                 average_lap_time=0.0,
                 total_elapsed_time=0.0
             )
+        else:
+            # Todo sale de los agregados incrementales: ningún recorrido.
+            # El tiempo total es el total_time del lap más reciente (head)
+            stats = LapStatistics(
+                total_laps=self._count,
+                fastest_lap=self._fastest,
+                slowest_lap=self._slowest,
+                average_lap_time=round(self._time_sum / self._count, 2),
+                total_elapsed_time=self.laps.head.data.total_time
+            )
         
-        # Calcular estadísticas
-        fastest = self.get_fastest_lap()
-        slowest = self.get_slowest_lap()
-        average = self.get_average_lap_time()
-        
-        # El tiempo total es el total_time del último lap (el más reciente)
-        total_elapsed = all_laps[0].total_time if all_laps else 0.0
-        
-        return LapStatistics(
-            total_laps=len(all_laps),
-            fastest_lap=fastest,
-            slowest_lap=slowest,
-            average_lap_time=average,
-            total_elapsed_time=total_elapsed
-        )
+        self._stats_cache = stats
+        self._stats_cache_version = self.laps.version
+        return stats
     
     # ========================================================================
     # MÉTODOS DE NAVEGACIÓN CIRCULAR
@@ -204,21 +246,19 @@ class StopwatchService:
         Returns:
             Lap | None: Siguiente/anterior lap o None
         """
-        # Buscar lap actual
-        lap = self.get_lap_by_number(lap_number)
-        if not lap:
+        # Buscar nodo actual en el índice (O(1), sin recorrer la lista)
+        node = self._number_index.get(lap_number)
+        if node is None:
             return None
         
-        # Navegar según dirección
+        # Navegar según dirección siguiendo los punteros del nodo
         if direction == "next":
-            next_data = self.laps.get_next(lap)
+            return node.next.data
         elif direction == "prev":
-            next_data = self.laps.get_previous(lap)
+            return node.prev.data
         else:
             logger.warning(f"Dirección inválida: {direction}")
             return None
-        
-        return next_data
     
     def get_first_lap(self) -> Optional[Lap]:
         """
@@ -251,6 +291,18 @@ class StopwatchService:
         Limpia todos los laps del cronómetro.
         """
         self.laps.clear()
+        self._number_index.clear()
+        self._id_index.clear()
+        self._dump_cache.clear()
+        self._reset_aggregates()
+        # Sesión nueva: los IDs y números de lap vuelven a empezar
+        self._next_id = 1
+        self._next_lap_number = 1
+        # Invalidar la vista memoizada y la columna de tiempos
+        self._laps_cache = None
+        self._laps_cache_version = -1
+        self._times_cache = None
+        self._times_cache_version = -1
         self._save_to_json()
         logger.info("Laps limpiados")
     
@@ -264,16 +316,20 @@ class StopwatchService:
         Returns:
             bool: True si se eliminó, False si no existía
         """
-        lap = self.get_lap_by_id(lap_id)
-        if not lap:
+        node = self._id_index.pop(lap_id, None)
+        if node is None:
             return False
         
-        deleted = self.laps.delete(lap)
-        if deleted:
-            self._save_to_json()
-            logger.info(f"Lap eliminado: ID={lap_id}")
+        # Desenlazar en O(1) con el nodo del índice, sin buscar el dato
+        lap = node.data
+        self.laps.remove_node(node)
+        self._number_index.pop(lap.lap_number, None)
+        self._dump_cache.pop(lap_id, None)
+        self._update_aggregates_on_delete(lap)
+        self._save_to_json()
+        logger.info(f"Lap eliminado: ID={lap_id}")
         
-        return deleted
+        return True
     
     # ========================================================================
     # MÉTODOS DE CONSULTA
@@ -286,7 +342,7 @@ class StopwatchService:
         Returns:
             int: Cantidad de laps
         """
-        return len(self.laps)
+        return self._count
     
     def get_laps_faster_than(self, time: float) -> list[Lap]:
         """
@@ -298,7 +354,8 @@ class StopwatchService:
         Returns:
             list[Lap]: Laps más rápidos
         """
-        return self.laps.find_all(lambda l: l.lap_time < time)
+        laps_view = self.get_all_laps()
+        return [lap for lap, t in zip(laps_view, self._get_lap_times()) if t < time]
     
     def get_laps_slower_than(self, time: float) -> list[Lap]:
         """
@@ -310,7 +367,8 @@ class StopwatchService:
         Returns:
             list[Lap]: Laps más lentos
         """
-        return self.laps.find_all(lambda l: l.lap_time > time)
+        laps_view = self.get_all_laps()
+        return [lap for lap, t in zip(laps_view, self._get_lap_times()) if t > time]
     
     # ========================================================================
     # MÉTODOS PRIVADOS - PERSISTENCIA Y AUXILIARES
@@ -320,22 +378,151 @@ class StopwatchService:
         """Carga laps desde el archivo JSON."""
         data = self.json_db.read_as_list()
         
-        # Cargar en orden inverso para mantener el orden correcto
-        # (el más reciente debe estar al inicio)
+        # Construir primero en orden inverso (el más reciente al inicio)
+        loaded: list[Lap] = []
         for item in reversed(data):
             try:
-                lap = Lap(**item)
-                self.laps.insert_at_end(lap)
+                # Los datos fueron validados al escribirse: model_construct
+                # evita re-validar campo por campo en cada arranque
+                lap = Lap.model_construct(
+                    id=item["id"],
+                    lap_number=item["lap_number"],
+                    lap_time=item["lap_time"],
+                    total_time=item["total_time"],
+                    timestamp=datetime.fromisoformat(item["timestamp"]),
+                )
+                loaded.append(lap)
+                self._update_aggregates_on_add(lap)
+                # Mantener los contadores por encima de todo lo cargado
+                self._next_id = max(self._next_id, lap.id + 1)
+                self._next_lap_number = max(self._next_lap_number, lap.lap_number + 1)
             except Exception as e:
                 logger.error(f"Error cargando lap: {e}")
         
+        # Empalmar la cadena completa de una vez: un número constante de
+        # reconexiones en vez de una inserción (y su fixup) por lap
+        nodes = self.laps.extend(loaded)
+        for lap, node in zip(loaded, nodes):
+            self._number_index[lap.lap_number] = node
+            self._id_index[lap.id] = node
+        
         logger.info(f"Cargados {len(self.laps)} laps desde JSON")
     
     def _save_to_json(self) -> None:
-        """Guarda el estado actual de laps en JSON."""
-        data = [lap.model_dump(mode='json') for lap in self.get_all_laps()]
-        self.json_db.write(data)
-        logger.debug(f"Guardados {len(data)} laps en JSON")
+        """
+        Guarda el estado actual de laps en JSON.
+        
+        El archivo queda en orden cronológico (más antiguo primero), el
+        mismo orden que produce el empalme de add_lap, para que ambos
+        caminos de persistencia sean intercambiables al recargar.
+        
+        La escritura se difiere al hilo escritor de JSONDatabase: ráfagas
+        de eliminaciones colapsan en un solo volcado con el estado final.
+        """
+        if not self._persist:
+            return
+        self.json_db.write_delayed(self._dump_laps)
+    
+    def _dump_laps(self) -> list[dict]:
+        """
+        Serializa todos los laps a dicts listos para JSON, en orden
+        cronológico.
+        
+        Reutiliza los dicts cacheados por ID: model_dump solo corre para
+        laps sin cache (p. ej. cargados en un arranque anterior). Sin
+        mode='json': el escritor serializa datetime nativamente (orjson)
+        o vía default=str.
+        
+        Returns:
+            list[dict]: Laps serializados, más antiguo primero
+        """
+        data = []
+        for lap in self.laps.get_all_reverse():
+            payload = self._dump_cache.get(lap.id)
+            if payload is None:
+                payload = lap.model_dump()
+                self._dump_cache[lap.id] = payload
+            data.append(payload)
+        return data
+    
+    def _update_aggregates_on_add(self, lap: Lap) -> None:
+        """
+        Actualiza los agregados incrementales al agregar un lap.
+        
+        Args:
+            lap: Lap recién agregado
+        """
+        self._count += 1
+        self._time_sum += lap.lap_time
+        
+        if self._fastest is None or lap.lap_time < self._fastest.lap_time:
+            self._fastest = lap
+        if self._slowest is None or lap.lap_time > self._slowest.lap_time:
+            self._slowest = lap
+    
+    def _update_aggregates_on_delete(self, lap: Lap) -> None:
+        """
+        Actualiza los agregados incrementales al eliminar un lap.
+        
+        Solo si el eliminado era un extremo (más rápido o más lento) hace
+        falta un recorrido para encontrar los nuevos extremos.
+        
+        Args:
+            lap: Lap eliminado
+        """
+        self._count -= 1
+        self._time_sum -= lap.lap_time
+        
+        if self._count == 0:
+            self._reset_aggregates()
+            return
+        
+        if lap is self._fastest or lap is self._slowest:
+            self._recompute_extremes()
+    
+    def _recompute_extremes(self) -> None:
+        """
+        Recalcula el lap más rápido y el más lento en una sola pasada.
+        
+        Camino de respaldo cuando se elimina un extremo. Opera sobre la
+        columna contigua de tiempos: min/max/index son bucles C sobre
+        doubles empaquetados, mucho más rápidos que iterar nodos y
+        comparar atributos en Python.
+        
+        Aprovecha la pasada para resincronizar la suma incremental con
+        math.fsum, que no acumula el error de redondeo que las sumas y
+        restas sucesivas de floats van dejando en _time_sum.
+        """
+        laps_view = self.get_all_laps()
+        times = self._get_lap_times()
+        
+        self._fastest = laps_view[times.index(min(times))]
+        self._slowest = laps_view[times.index(max(times))]
+        self._time_sum = math.fsum(times)
+    
+    def _get_lap_times(self) -> array:
+        """
+        Retorna la columna de tiempos de lap, paralela a get_all_laps().
+        
+        Memoizada con la misma versión de la lista que la vista de laps:
+        ambas se reconstruyen juntas tras una mutación.
+        
+        Returns:
+            array: Tiempos de lap como doubles contiguos
+        """
+        if self._times_cache_version != self.laps.version:
+            self._times_cache = array(
+                'd', (lap.lap_time for lap in self.get_all_laps())
+            )
+            self._times_cache_version = self.laps.version
+        return self._times_cache
+    
+    def _reset_aggregates(self) -> None:
+        """Reinicia los agregados incrementales (lista vacía)."""
+        self._count = 0
+        self._time_sum = 0.0
+        self._fastest = None
+        self._slowest = None
     
     def _generate_id(self) -> int:
         """
@@ -344,12 +531,9 @@ class StopwatchService:
         Returns:
             int: Nuevo ID
         """
-        if self.laps.is_empty():
-            return 1
-        
-        all_laps = self.get_all_laps()
-        max_id = max(lap.id for lap in all_laps)
-        return max_id + 1
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
     
     def _get_next_lap_number(self) -> int:
         """
@@ -358,12 +542,9 @@ class StopwatchService:
         Returns:
             int: Número del próximo lap
         """
-        if self.laps.is_empty():
-            return 1
-        
-        all_laps = self.get_all_laps()
-        max_number = max(lap.lap_number for lap in all_laps)
-        return max_number + 1
+        number = self._next_lap_number
+        self._next_lap_number += 1
+        return number
 
 
 # ============================================================================
@@ -375,8 +556,8 @@ if __name__ == "__main__":
     print("⏱️  EJEMPLO DE USO - STOPWATCH SERVICE")
     print("=" * 70)
     
-    # Crear servicio
-    service = StopwatchService()
+    # Crear servicio sin persistencia: el demo no toca el archivo real
+    service = StopwatchService(persist=False)
     
     # Limpiar laps previos
     service.clear_laps()
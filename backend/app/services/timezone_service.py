@@ -6,10 +6,12 @@ Servicio de gestión de zonas horarias usando Lista Circular Doble.
 
 from typing import Optional
 import logging
+import threading
 import requests
 from datetime import datetime, timedelta
 
 from app.data_structures.circular_doubly_linked_list import CircularDoublyLinkedList
+from app.data_structures.node import Node
 from app.models.timezone import Timezone, TimezoneCreate, FavoriteTimezone, generate_timezone_id
 from app.database.json_db import JSONDatabase
 from app.config import get_settings
@@ -17,6 +19,72 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# TABLAS DE MAPEO DE ZONAS (CONSTANTES DE MÓDULO)
+# ============================================================================
+
+# Planas y keyed por el nombre IANA completo: una búsqueda de hash por
+# zona, y los literales se construyen una sola vez al importar el módulo
+# en vez de en cada llamada
+
+_TZ_NAME_TO_COUNTRY = {
+    # América
+    "America/New_York": "Estados Unidos", "America/Los_Angeles": "Estados Unidos",
+    "America/Chicago": "Estados Unidos", "America/Denver": "Estados Unidos",
+    "America/Toronto": "Canadá", "America/Mexico_City": "México",
+    "America/Bogota": "Colombia", "America/Lima": "Perú",
+    "America/Santiago": "Chile", "America/Buenos_Aires": "Argentina",
+    "America/Sao_Paulo": "Brasil",
+    
+    # Europa
+    "Europe/London": "Reino Unido", "Europe/Paris": "Francia",
+    "Europe/Berlin": "Alemania", "Europe/Madrid": "España",
+    "Europe/Rome": "Italia", "Europe/Moscow": "Rusia",
+    "Europe/Amsterdam": "Países Bajos", "Europe/Brussels": "Bélgica",
+    
+    # Asia
+    "Asia/Tokyo": "Japón", "Asia/Seoul": "Corea del Sur",
+    "Asia/Shanghai": "China", "Asia/Beijing": "China",
+    "Asia/Kolkata": "India", "Asia/Dubai": "Emiratos Árabes Unidos",
+    "Asia/Bangkok": "Tailandia", "Asia/Singapore": "Singapur",
+    
+    # Oceanía
+    "Australia/Sydney": "Australia", "Australia/Melbourne": "Australia",
+    "Pacific/Auckland": "Nueva Zelanda", "Pacific/Fiji": "Fiyi",
+    
+    # África
+    "Africa/Cairo": "Egipto", "Africa/Johannesburg": "Sudáfrica",
+    "Africa/Lagos": "Nigeria", "Africa/Nairobi": "Kenia",
+}
+
+_TZ_NAME_TO_OFFSET = {
+    # América
+    "America/New_York": "UTC-5", "America/Los_Angeles": "UTC-8",
+    "America/Chicago": "UTC-6", "America/Denver": "UTC-7",
+    "America/Bogota": "UTC-5", "America/Mexico_City": "UTC-6",
+    "America/Sao_Paulo": "UTC-3", "America/Buenos_Aires": "UTC-3",
+    "America/Lima": "UTC-5", "America/Santiago": "UTC-3",
+    "America/Toronto": "UTC-5",
+    
+    # Europa
+    "Europe/London": "UTC+0", "Europe/Paris": "UTC+1",
+    "Europe/Berlin": "UTC+1", "Europe/Madrid": "UTC+1",
+    "Europe/Rome": "UTC+1", "Europe/Moscow": "UTC+3",
+    "Europe/Amsterdam": "UTC+1",
+    
+    # Asia
+    "Asia/Tokyo": "UTC+9", "Asia/Shanghai": "UTC+8",
+    "Asia/Seoul": "UTC+9", "Asia/Kolkata": "UTC+5:30",
+    "Asia/Dubai": "UTC+4", "Asia/Bangkok": "UTC+7",
+    
+    # Oceanía
+    "Australia/Sydney": "UTC+10", "Pacific/Auckland": "UTC+12",
+    
+    # África
+    "Africa/Cairo": "UTC+2", "Africa/Johannesburg": "UTC+2",
+}
+
+
 class TimezoneService:
     """Servicio para gestionar zonas horarias usando lista circular doble."""
     
@@ -64,11 +132,46 @@ class TimezoneService:
     def __init__(self):
         """Inicializa el servicio."""
         self.favorites = CircularDoublyLinkedList[FavoriteTimezone]()
+        # Índice timezone_id -> nodo para acceso O(1) sin recorrer la lista
+        self._favorites_index: dict[str, Node[FavoriteTimezone]] = {}
         self.available_timezones: list[Timezone] = []
+        # Índice id -> zona del catálogo: búsquedas por ID en O(1) en vez
+        # de recorrer la lista (se reconstruye con cada catálogo nuevo)
+        self._tz_by_id: dict[str, Timezone] = {}
+        # Vistas derivadas del catálogo, construidas perezosamente y
+        # descartadas cuando llega un catálogo nuevo
+        self._countries_cache: Optional[list[str]] = None
+        self._by_country: Optional[dict[str, list[Timezone]]] = None
+        # Haystack en minúsculas "país|ciudad|id" paralelo al catálogo:
+        # las búsquedas hacen una sola subcadena C por candidato, sin
+        # pagar str.lower() por campo por consulta ('|' no aparece en
+        # ningún campo, así que no crea coincidencias entre campos)
+        self._search_lc: Optional[list[str]] = None
         self.last_api_fetch: Optional[datetime] = None
         
+        # Versión del catálogo de zonas: solo cambia cuando un refresh
+        # exitoso reemplaza el catálogo (base para ETags en el router)
+        self._catalog_version = 1
+        
+        # Cache de estadísticas: se invalida con cada mutación (versión monotónica)
+        self._stats_version = 0
+        self._stats_cache: Optional[dict] = None
+        
+        # Lock para coalescer refreshes concurrentes (single-flight)
+        self._refresh_lock = threading.Lock()
+        
+        # Sesión HTTP persistente (keep-alive: sin handshake TCP por
+        # refresh) y validadores para GETs condicionales
+        self._http = requests.Session()
+        self._last_etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        
         settings = get_settings()
         self.json_db = JSONDatabase(settings.TIMEZONES_FILE)
+        # Caché en disco del catálogo: el arranque con caché fresco no
+        # paga la vuelta por la red
+        self._catalog_cache_file = settings.TIMEZONES_CACHE_FILE
+        self._catalog_cache_db = JSONDatabase(self._catalog_cache_file)
         
         self._load_available_timezones()
         self._load_favorites_from_json()
@@ -82,59 +185,85 @@ class TimezoneService:
     def get_available_timezones(self, force_refresh: bool = False) -> list[Timezone]:
         """Obtiene todas las zonas horarias disponibles."""
         if force_refresh or self._should_refresh_cache():
-            self._fetch_timezones_from_api()
+            self.refresh_timezones()
         return self.available_timezones
     
     def search_timezone(self, query: str) -> list[Timezone]:
         """Busca zonas horarias por país, ciudad o región."""
+        if self._search_lc is None:
+            self._search_lc = [
+                f"{tz.country.lower()}|{tz.city.lower()}|{tz.id.lower()}"
+                for tz in self.available_timezones
+            ]
+        
         query_lower = query.lower()
         return [
-            tz for tz in self.available_timezones
-            if query_lower in tz.country.lower() 
-            or query_lower in tz.city.lower()
-            or query_lower in tz.id.lower()
+            tz for tz, haystack
+            in zip(self.available_timezones, self._search_lc)
+            if query_lower in haystack
         ]
     
     def get_timezone_by_id(self, timezone_id: str) -> Optional[Timezone]:
-        """Busca una zona horaria disponible por su ID."""
-        for tz in self.available_timezones:
-            if tz.id == timezone_id:
-                return tz
-        return None
+        """Busca una zona horaria disponible por su ID (O(1) vía índice)."""
+        return self._tz_by_id.get(timezone_id)
     
     def get_timezones_by_country(self, country: str) -> list[Timezone]:
-        """Obtiene todas las zonas horarias de un país."""
-        country_lower = country.lower()
-        return [
-            tz for tz in self.available_timezones
-            if tz.country.lower() == country_lower
-        ]
+        """Obtiene todas las zonas horarias de un país (agrupación memoizada)."""
+        if self._by_country is None:
+            by_country: dict[str, list[Timezone]] = {}
+            for tz in self.available_timezones:
+                by_country.setdefault(tz.country.lower(), []).append(tz)
+            self._by_country = by_country
+        return self._by_country.get(country.lower(), [])
     
     def get_countries(self) -> list[str]:
-        """Obtiene lista de países únicos disponibles."""
-        countries = sorted(set(tz.country for tz in self.available_timezones))
-        return countries
+        """Obtiene lista de países únicos disponibles (memoizada)."""
+        if self._countries_cache is None:
+            self._countries_cache = sorted(
+                {tz.country for tz in self.available_timezones}
+            )
+        return self._countries_cache
     
     def refresh_timezones(self) -> bool:
-        """Fuerza refresh de zonas horarias desde la API."""
-        return self._fetch_timezones_from_api()
+        """
+        Fuerza refresh de zonas horarias desde la API.
+        
+        Si ya hay un refresh en curso, no duplica la llamada HTTP:
+        espera a que el primero termine y reutiliza su resultado
+        (patrón single-flight).
+        """
+        if self._refresh_lock.acquire(blocking=False):
+            try:
+                return self._fetch_timezones_from_api()
+            finally:
+                self._refresh_lock.release()
+        
+        # Otro request ya está refrescando: esperar y reusar su resultado
+        with self._refresh_lock:
+            return self.last_api_fetch is not None and not self._should_refresh_cache()
     
     # ========================================================================
     # MÉTODOS PÚBLICOS - GESTIÓN DE FAVORITOS
     # ========================================================================
     
-    def add_favorite(self, timezone_id: str) -> Optional[FavoriteTimezone]:
-        """Agrega una zona horaria a favoritos."""
+    def add_favorite(self, timezone_id: str) -> FavoriteTimezone:
+        """
+        Agrega una zona horaria a favoritos.
+        
+        Raises:
+            KeyError: Si la zona horaria no existe en el catálogo
+            ValueError: Si la zona horaria ya está en favoritos
+        """
         tz = self.get_timezone_by_id(timezone_id)
         if not tz:
             logger.warning(f"Zona horaria no disponible: {timezone_id}")
-            return None
+            raise KeyError(f"Zona horaria no disponible: {timezone_id}")
         
         if self._is_favorite(timezone_id):
             logger.warning(f"Zona horaria ya en favoritos: {timezone_id}")
-            return None
+            raise ValueError(f"Zona horaria ya en favoritos: {timezone_id}")
         
-        order = self.favorites.size()
+        order = len(self.favorites)
         
         favorite = FavoriteTimezone(
             id=tz.id,
@@ -144,7 +273,9 @@ class TimezoneService:
             order=order
         )
         
-        self.favorites.insert_at_end(favorite)
+        node = self.favorites.insert_at_end(favorite)
+        self._favorites_index[favorite.id] = node
+        self._invalidate_stats()
         self._save_favorites_to_json()
         
         logger.info(f"✅ Zona horaria agregada a favoritos: {timezone_id}")
@@ -152,19 +283,20 @@ class TimezoneService:
     
     def remove_favorite(self, timezone_id: str) -> bool:
         """Elimina una zona horaria de favoritos."""
-        favorite = self._find_favorite(timezone_id)
-        if not favorite:
+        node = self._favorites_index.pop(timezone_id, None)
+        if node is None:
             logger.warning(f"Zona horaria no encontrada en favoritos: {timezone_id}")
             return False
         
-        deleted = self.favorites.delete(favorite)
-        
-        if deleted:
-            self._reorder_favorites()
-            self._save_favorites_to_json()
-            logger.info(f"🗑️ Zona horaria eliminada de favoritos: {timezone_id}")
+        # Desenlazar en O(1) con el nodo del índice, sin recorrer la
+        # lista comparando modelos completos con __eq__
+        self.favorites.remove_node(node)
+        self._reorder_favorites()
+        self._invalidate_stats()
+        self._save_favorites_to_json()
+        logger.info(f"🗑️ Zona horaria eliminada de favoritos: {timezone_id}")
         
-        return deleted
+        return True
     
     def get_favorites(self) -> list[FavoriteTimezone]:
         """Obtiene todas las zonas horarias favoritas en orden."""
@@ -172,26 +304,23 @@ class TimezoneService:
     
     def reorder_favorite(self, timezone_id: str, new_position: int) -> bool:
         """Cambia el orden de una zona horaria favorita."""
-        if new_position < 0 or new_position >= self.favorites.size():
+        if new_position < 0 or new_position >= len(self.favorites):
             logger.warning(f"Posición inválida: {new_position}")
             return False
         
-        favorite = self._find_favorite(timezone_id)
-        if not favorite:
+        node = self._favorites_index.get(timezone_id)
+        if node is None:
             return False
         
+        favorite = node.data
         if favorite.order == new_position:
             return True
         
-        all_favorites = self.favorites.get_all()
-        all_favorites = [f for f in all_favorites if f.id != timezone_id]
-        all_favorites.insert(new_position, favorite)
-        
-        self.favorites.clear()
-        for i, fav in enumerate(all_favorites):
-            fav.order = i
-            self.favorites.insert_at_end(fav)
+        # Mover el nodo en sitio: cirugía de punteros sin alocar nodos
+        # nuevos, y el índice id -> nodo sigue siendo válido tal cual
+        self.favorites.move_to_position(node, new_position)
         
+        self._reorder_favorites()
         self._save_favorites_to_json()
         
         logger.info(f"🔄 Zona horaria reordenada: {timezone_id} -> posición {new_position}")
@@ -199,19 +328,19 @@ class TimezoneService:
     
     def navigate_favorites(self, timezone_id: str, direction: str) -> Optional[FavoriteTimezone]:
         """Navega circularmente entre favoritos."""
-        favorite = self._find_favorite(timezone_id)
-        if not favorite:
+        # Buscar nodo actual en el índice (O(1), sin recorrer la lista)
+        node = self._favorites_index.get(timezone_id)
+        if node is None:
             return None
         
+        # Navegar según dirección siguiendo los punteros del nodo
         if direction == "next":
-            next_data = self.favorites.get_next(favorite)
+            return node.next.data
         elif direction == "prev":
-            next_data = self.favorites.get_previous(favorite)
+            return node.prev.data
         else:
             logger.warning(f"Dirección inválida: {direction}")
             return None
-        
-        return next_data
     
     def get_first_favorite(self) -> Optional[FavoriteTimezone]:
         """Obtiene el primer favorito."""
@@ -227,33 +356,115 @@ class TimezoneService:
         """Verifica si una zona horaria está en favoritos."""
         return self._is_favorite(timezone_id)
     
+    def get_catalog_version(self) -> int:
+        """Retorna la versión actual del catálogo de zonas horarias."""
+        return self._catalog_version
+    
     def get_stats(self) -> dict:
         """Obtiene estadísticas del servicio."""
+        # Los conteos son O(N) sobre zonas y favoritos: se memorizan hasta la
+        # próxima mutación. Los campos dependientes del reloj se calculan siempre.
+        if self._stats_cache is None:
+            self._stats_cache = {
+                "total_available": len(self.available_timezones),
+                "total_favorites": self.count_favorites(),
+                "total_countries": len(self.get_countries()),
+            }
+        
         return {
-            "total_available": len(self.available_timezones),
-            "total_favorites": self.count_favorites(),
-            "total_countries": len(self.get_countries()),
+            **self._stats_cache,
             "last_api_fetch": self.last_api_fetch.isoformat() if self.last_api_fetch else None,
             "cache_valid": not self._should_refresh_cache()
         }
     
+    def _invalidate_stats(self) -> None:
+        """Invalida el cache de estadísticas tras una mutación."""
+        self._stats_version += 1
+        self._stats_cache = None
+    
     # ========================================================================
     # MÉTODOS PRIVADOS - OPTIMIZADOS
     # ========================================================================
     
     def _load_available_timezones(self) -> None:
         """Carga zonas horarias con estrategia optimizada."""
+        # Primero el caché en disco: si sigue fresco, no hay viaje a la API
+        if self._load_catalog_from_cache():
+            return
+        
         if self._should_refresh_cache():
             logger.info("⏳ Intentando obtener zonas horarias desde API...")
             api_success = self._fetch_timezones_from_api()
             
             if not api_success:
                 logger.info("ℹ️ Usando zonas horarias de fallback")
-                self.available_timezones = self._get_fallback_timezones()
+                self._set_catalog(self._get_fallback_timezones())
         else:
             if not self.available_timezones:
                 logger.info("📦 Usando zonas horarias de fallback (no hay caché)")
-                self.available_timezones = self._get_fallback_timezones()
+                self._set_catalog(self._get_fallback_timezones())
+    
+    def _load_catalog_from_cache(self) -> bool:
+        """
+        Intenta cargar el catálogo desde el caché en disco.
+        
+        El mtime del archivo hace de TTL: un caché más viejo que
+        CACHE_EXPIRY_HOURS se ignora y la carga sigue por API/fallback.
+        
+        Returns:
+            bool: True si el catálogo se cargó desde el caché
+        """
+        try:
+            mtime = self._catalog_cache_file.stat().st_mtime
+        except OSError:
+            return False
+        
+        fetched_at = datetime.fromtimestamp(mtime)
+        if datetime.now() - fetched_at > timedelta(hours=self.CACHE_EXPIRY_HOURS):
+            return False
+        
+        data = self._catalog_cache_db.read_as_list()
+        if not data:
+            return False
+        
+        try:
+            # Los datos fueron validados al escribirse: model_construct
+            # evita re-validar campo por campo en cada arranque
+            timezones = [
+                Timezone.model_construct(
+                    id=item["id"],
+                    country=item["country"],
+                    city=item["city"],
+                    offset=item["offset"],
+                    is_favorite=item.get("is_favorite", False),
+                )
+                for item in data
+            ]
+        except Exception as e:
+            logger.error(f"Error cargando caché del catálogo: {e}")
+            return False
+        
+        self._set_catalog(timezones)
+        self.last_api_fetch = fetched_at
+        logger.info(f"📦 Catálogo cargado desde caché en disco ({len(timezones)} zonas)")
+        return True
+    
+    def _set_catalog(self, timezones: list[Timezone]) -> None:
+        """
+        Reemplaza el catálogo de zonas disponibles y reconstruye los
+        índices derivados.
+        
+        Único punto de asignación de available_timezones: garantiza que
+        el índice por ID nunca quede desincronizado del catálogo.
+        
+        Args:
+            timezones: Nuevo catálogo completo
+        """
+        self.available_timezones = timezones
+        self._tz_by_id = {tz.id: tz for tz in timezones}
+        self._countries_cache = None
+        self._by_country = None
+        self._search_lc = None
     
     def _fetch_timezones_from_api(self) -> bool:
         """
@@ -263,10 +474,28 @@ class TimezoneService:
         try:
             url = f"{self.WORLDTIME_API_BASE}/timezone"
             
-            response = requests.get(url, timeout=5)
+            # GET condicional: si el catálogo remoto no cambió desde el
+            # último fetch, el 304 evita descargar y re-parsear el JSON
+            headers = {}
+            if self._last_etag:
+                headers["If-None-Match"] = self._last_etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+            
+            response = self._http.get(url, timeout=5, headers=headers)
+            
+            if response.status_code == 304:
+                self.last_api_fetch = datetime.now()
+                logger.info("✅ Catálogo remoto sin cambios (304): caché renovado")
+                return True
+            
             response.raise_for_status()
+            self._last_etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
             
-            timezone_names = response.json()
+            # Como set: 35 chequeos de pertenencia O(1) en vez de un
+            # escaneo lineal de la lista completa por cada zona candidata
+            timezone_names = set(response.json())
             
             # ✅ FILTRO MEJORADO: Seleccionar zonas de diferentes regiones
             selected_timezones = []
@@ -329,8 +558,15 @@ class TimezoneService:
                         continue
             
             if timezones:
-                self.available_timezones = timezones
+                self._set_catalog(timezones)
                 self.last_api_fetch = datetime.now()
+                self._catalog_version += 1
+                self._invalidate_stats()
+                # Persistir el catálogo: el próximo arranque dentro del
+                # TTL lo lee de disco en vez de volver a la API
+                self._catalog_cache_db.write(
+                    [tz.model_dump() for tz in timezones]
+                )
                 logger.info(f"✅ Obtenidas {len(timezones)} zonas horarias desde API")
                 return True
             else:
@@ -349,98 +585,39 @@ class TimezoneService:
     
     def _estimate_offset_from_name(self, timezone_name: str) -> str:
         """Estima el offset UTC basado en el nombre de la zona horaria."""
-        offset_map = {
-            # América
-            "America/New_York": "UTC-5", "America/Los_Angeles": "UTC-8",
-            "America/Chicago": "UTC-6", "America/Denver": "UTC-7",
-            "America/Bogota": "UTC-5", "America/Mexico_City": "UTC-6",
-            "America/Sao_Paulo": "UTC-3", "America/Buenos_Aires": "UTC-3",
-            "America/Lima": "UTC-5", "America/Santiago": "UTC-3",
-            "America/Toronto": "UTC-5",
-            
-            # Europa
-            "Europe/London": "UTC+0", "Europe/Paris": "UTC+1",
-            "Europe/Berlin": "UTC+1", "Europe/Madrid": "UTC+1",
-            "Europe/Rome": "UTC+1", "Europe/Moscow": "UTC+3",
-            "Europe/Amsterdam": "UTC+1",
-            
-            # Asia
-            "Asia/Tokyo": "UTC+9", "Asia/Shanghai": "UTC+8",
-            "Asia/Seoul": "UTC+9", "Asia/Kolkata": "UTC+5:30",
-            "Asia/Dubai": "UTC+4", "Asia/Bangkok": "UTC+7",
-            
-            # Oceanía
-            "Australia/Sydney": "UTC+10", "Pacific/Auckland": "UTC+12",
-            
-            # África
-            "Africa/Cairo": "UTC+2", "Africa/Johannesburg": "UTC+2",
-        }
-        
-        return offset_map.get(timezone_name, "UTC+0")
+        return _TZ_NAME_TO_OFFSET.get(timezone_name, "UTC+0")
     
     def _map_region_to_country(self, region: str, full_name: str) -> str:
-        """
-        Mapea una región a un nombre de país.
-        ✅ MEJORADO: Ahora mapea correctamente TODAS las regiones.
-        """
-        region_mapping = {
-            "America": {
-                "New_York": "Estados Unidos", "Los_Angeles": "Estados Unidos",
-                "Chicago": "Estados Unidos", "Denver": "Estados Unidos",
-                "Toronto": "Canadá", "Mexico_City": "México",
-                "Bogota": "Colombia", "Lima": "Perú",
-                "Santiago": "Chile", "Buenos_Aires": "Argentina",
-                "Sao_Paulo": "Brasil",
-            },
-            "Europe": {
-                "London": "Reino Unido", "Paris": "Francia",
-                "Berlin": "Alemania", "Madrid": "España",
-                "Rome": "Italia", "Moscow": "Rusia",
-                "Amsterdam": "Países Bajos", "Brussels": "Bélgica",
-            },
-            "Asia": {
-                "Tokyo": "Japón", "Seoul": "Corea del Sur",
-                "Shanghai": "China", "Beijing": "China",
-                "Kolkata": "India", "Dubai": "Emiratos Árabes Unidos",
-                "Bangkok": "Tailandia", "Singapore": "Singapur",
-            },
-            "Australia": {
-                "Sydney": "Australia", "Melbourne": "Australia",
-            },
-            "Africa": {
-                "Cairo": "Egipto", "Johannesburg": "Sudáfrica",
-                "Lagos": "Nigeria", "Nairobi": "Kenia",
-            },
-            "Pacific": {
-                "Auckland": "Nueva Zelanda", "Fiji": "Fiyi",
-            }
-        }
+        """Mapea el nombre IANA completo de una zona a un nombre de país."""
+        country = _TZ_NAME_TO_COUNTRY.get(full_name)
+        if country is not None:
+            return country
         
-        parts = full_name.split('/')
-        if len(parts) >= 2:
-            city_key = parts[-1]
-            
-            if region in region_mapping and city_key in region_mapping[region]:
-                return region_mapping[region][city_key]
-        
-        # Fallback
+        # Fallback: usar la región como nombre legible
         return region.replace("_", " ").title()
     
+    # Objetos Timezone del fallback, construidos una sola vez a nivel de
+    # clase: la validación Pydantic de las 26 zonas no se repite en cada
+    # caída a fallback. Compartidos sin copiar porque el catálogo se
+    # trata como de solo lectura en todo el servicio.
+    _FALLBACK_TIMEZONE_OBJECTS: Optional[tuple[Timezone, ...]] = None
+    
     def _get_fallback_timezones(self) -> list[Timezone]:
         """Retorna conjunto básico de zonas horarias."""
-        timezones = []
-        for country, city, offset in self.FALLBACK_TIMEZONES:
-            tz_id = generate_timezone_id(country, city)
-            tz = Timezone(
-                id=tz_id,
-                country=country,
-                city=city,
-                offset=offset,
-                is_favorite=False
+        cls = type(self)
+        if cls._FALLBACK_TIMEZONE_OBJECTS is None:
+            cls._FALLBACK_TIMEZONE_OBJECTS = tuple(
+                Timezone(
+                    id=generate_timezone_id(country, city),
+                    country=country,
+                    city=city,
+                    offset=offset,
+                    is_favorite=False
+                )
+                for country, city, offset in self.FALLBACK_TIMEZONES
             )
-            timezones.append(tz)
         
-        return timezones
+        return list(cls._FALLBACK_TIMEZONE_OBJECTS)
     
     def _should_refresh_cache(self) -> bool:
         """Determina si el caché debe refrescarse."""
@@ -460,29 +637,63 @@ class TimezoneService:
         
         for item in data:
             try:
-                favorite = FavoriteTimezone(**item)
-                self.favorites.insert_at_end(favorite)
+                # Los datos fueron validados al escribirse: model_construct
+                # evita re-validar campo por campo en cada arranque
+                favorite = FavoriteTimezone.model_construct(
+                    id=item["id"],
+                    country=item["country"],
+                    city=item["city"],
+                    offset=item["offset"],
+                    order=item["order"],
+                )
+                node = self.favorites.insert_at_end(favorite)
+                self._favorites_index[favorite.id] = node
             except Exception as e:
                 logger.error(f"Error cargando favorito: {e}")
         
         logger.info(f"📂 Cargados {len(self.favorites)} favoritos desde JSON")
     
     def _save_favorites_to_json(self) -> None:
-        """Guarda el estado actual de favoritos en JSON."""
-        data = [fav.model_dump(mode='json') for fav in self.get_favorites()]
-        self.json_db.write(data)
-        logger.debug(f"💾 Guardados {len(data)} favoritos en JSON")
+        """
+        Guarda el estado actual de favoritos en JSON.
+        
+        La escritura se difiere al hilo escritor de JSONDatabase: una
+        ráfaga de mutaciones (p. ej. un drag de reordenamiento de la UI)
+        colapsa en un solo volcado con el estado final.
+        """
+        self.json_db.write_delayed(self._dump_favorites)
+    
+    def _dump_favorites(self) -> list[dict]:
+        """
+        Serializa todos los favoritos a dicts listos para JSON, en orden.
+        
+        Returns:
+            list[dict]: Favoritos serializados
+        """
+        # Dicts construidos a mano: los cinco campos son tipos primitivos,
+        # así que el volcado no paga el despacho reflexivo de model_dump
+        # (iterando la lista directamente, sin lista intermedia)
+        return [
+            {
+                "id": fav.id,
+                "country": fav.country,
+                "city": fav.city,
+                "offset": fav.offset,
+                "order": fav.order,
+            }
+            for fav in self.favorites
+        ]
     
     def _find_favorite(self, timezone_id: str) -> Optional[FavoriteTimezone]:
-        """Busca un favorito por ID."""
-        node = self.favorites.find(lambda f: f.id == timezone_id)
+        """Busca un favorito por ID en el índice (O(1), sin lambda ni recorrido)."""
+        node = self._favorites_index.get(timezone_id)
         return node.data if node else None
     
     def _is_favorite(self, timezone_id: str) -> bool:
         """Verifica si una zona está en favoritos."""
-        return self._find_favorite(timezone_id) is not None
+        return timezone_id in self._favorites_index
     
     def _reorder_favorites(self) -> None:
-        """Reajusta los órdenes de todos los favoritos."""
-        for i, favorite in enumerate(self.get_favorites()):
+        """Reajusta los órdenes de todos los favoritos en una sola pasada."""
+        for i, favorite in enumerate(self.favorites):
             favorite.order = i
\ No newline at end of file
@@ -3,10 +3,20 @@ Utilidades para manejo de tiempo.
 Funciones auxiliares para formateo y conversión de tiempo.
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Tuple
 
 
+# Memos de reloj para los bucles de refresco de la UI: la hora HH:MM se
+# regenera a lo sumo una vez por minuto y el prefijo del timestamp una
+# vez por segundo (un solo escritor en CPython; no requiere lock)
+_cached_minute = -1
+_cached_time_str = ""
+_cached_second = -1
+_cached_ts_prefix = ""
+
+
 def format_seconds_to_time(seconds: float) -> str:
     """
     Formatea segundos a formato MM:SS.ms
@@ -21,9 +31,38 @@ def format_seconds_to_time(seconds: float) -> str:
         >>> format_seconds_to_time(83.45)
         "01:23.45"
     """
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
-    return f"{minutes:02d}:{remaining_seconds:05.2f}"
+    # Pasar a centisegundos enteros primero: divmod y formateo de
+    # enteros en vez de módulo y formateo de float (y sin el artefacto
+    # de redondeo "00:60.00" cerca del minuto)
+    centiseconds = int(round(seconds * 100))
+    minutes, rem = divmod(centiseconds, 6000)
+    secs, hundredths = divmod(rem, 100)
+    return f"{minutes:02d}:{secs:02d}.{hundredths:02d}"
+
+
+def _fast_parse_hhmm(time_str: str) -> Tuple[int, int]:
+    """
+    Decodifica "HH:MM" canónico (5 caracteres) con aritmética de ordinales.
+    
+    Evita el split (que aloca una lista) y el parser general de int():
+    cuatro restas de ordinal y dos multiplicaciones. Para entradas que
+    no tienen la forma canónica retorna el centinela (-1, -1) sin
+    construir ninguna excepción.
+    
+    Args:
+        time_str: Candidato a hora "HH:MM"
+        
+    Returns:
+        Tuple[int, int]: (horas, minutos), o (-1, -1) si no es canónico
+    """
+    if len(time_str) == 5 and time_str[2] == ':':
+        h1 = ord(time_str[0]) - 48
+        h2 = ord(time_str[1]) - 48
+        m1 = ord(time_str[3]) - 48
+        m2 = ord(time_str[4]) - 48
+        if 0 <= h1 <= 9 and 0 <= h2 <= 9 and 0 <= m1 <= 9 and 0 <= m2 <= 9:
+            return h1 * 10 + h2, m1 * 10 + m2
+    return -1, -1
 
 
 def parse_time_string(time_str: str) -> Tuple[int, int]:
@@ -43,11 +82,17 @@ def parse_time_string(time_str: str) -> Tuple[int, int]:
         >>> parse_time_string("14:30")
         (14, 30)
     """
-    try:
-        hours, minutes = time_str.split(":")
-        return int(hours), int(minutes)
-    except Exception as e:
+    # Camino rápido para la forma canónica de 5 caracteres
+    hours, minutes = _fast_parse_hhmm(time_str)
+    if hours >= 0:
+        return hours, minutes
+    
+    # Camino lento para formas no canónicas como "7:30": validación
+    # explícita en vez de armar un manejador try/except por llamada
+    head, sep, tail = time_str.partition(":")
+    if not sep or not head.isdigit() or not tail.isdigit():
         raise ValueError(f"Formato de hora inválido: {time_str}. Debe ser HH:MM")
+    return int(head), int(tail)
 
 
 def is_valid_time(time_str: str) -> bool:
@@ -66,10 +111,15 @@ def is_valid_time(time_str: str) -> bool:
         >>> is_valid_time("25:00")
         False
     """
+    # Camino rápido sin excepciones: el centinela descarta lo malformado
+    hours, minutes = _fast_parse_hhmm(time_str)
+    if hours >= 0:
+        return hours <= 23 and minutes <= 59
+    
     try:
         hours, minutes = parse_time_string(time_str)
         return 0 <= hours <= 23 and 0 <= minutes <= 59
-    except:
+    except ValueError:
         return False
 
 
@@ -167,11 +217,10 @@ def add_minutes_to_time(time_str: str, minutes: int) -> str:
     """
     hours, mins = parse_time_string(time_str)
     
-    # Crear datetime para usar sus métodos
-    dt = datetime(2000, 1, 1, hours, mins)
-    dt += timedelta(minutes=minutes)
-    
-    return dt.strftime("%H:%M")
+    # Aritmética modular sobre minutos del día: sin construir datetime
+    # ni timedelta ni pasar por strftime
+    total = (hours * 60 + mins + minutes) % 1440
+    return f"{total // 60:02d}:{total % 60:02d}"
 
 
 def is_time_between(check_time: str, start_time: str, end_time: str) -> bool:
@@ -216,7 +265,14 @@ def get_current_time_str() -> str:
         >>> get_current_time_str()
         "14:30"
     """
-    return datetime.now().strftime("%H:%M")
+    global _cached_minute, _cached_time_str
+    
+    # Releer el reloj y reformatear solo cuando cambia el minuto
+    minute = int(time.time()) // 60
+    if minute != _cached_minute:
+        _cached_time_str = datetime.now().strftime("%H:%M")
+        _cached_minute = minute
+    return _cached_time_str
 
 
 def get_timestamp() -> str:
@@ -230,7 +286,16 @@ def get_timestamp() -> str:
         >>> get_timestamp()
         "2025-10-11T14:30:00.123456"
     """
-    return datetime.now().isoformat()
+    global _cached_second, _cached_ts_prefix
+    
+    # El prefijo hasta los segundos se memoriza por segundo; solo los
+    # microsegundos se formatean en cada llamada
+    now = time.time()
+    second = int(now)
+    if second != _cached_second:
+        _cached_ts_prefix = datetime.now().isoformat(timespec='seconds')
+        _cached_second = second
+    return f"{_cached_ts_prefix}.{int((now % 1) * 1_000_000):06d}"
 
 
 # ============================================================================